@@ -0,0 +1,1224 @@
+font_small = {
+    "fontheight": 8,
+    " ": [
+        4,
+        0b000,
+        0b000,
+        0b000,
+        0b000,
+        0b000,
+        0b000,
+        0b000,
+        0b000,
+    ],
+    "0": [
+        5,
+        0b01100,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b01100,
+        0b00000,
+    ],
+    "1": [
+        4,
+        0b0100,
+        0b1100,
+        0b0100,
+        0b0100,
+        0b0100,
+        0b0100,
+        0b1110,
+        0b0000,
+    ],
+    "2": [
+        5,
+        0b01100,
+        0b10010,
+        0b00010,
+        0b00100,
+        0b01000,
+        0b10000,
+        0b11110,
+        0b00000,
+    ],
+    "3": [
+        5,
+        0b11110,
+        0b00100,
+        0b01000,
+        0b00100,
+        0b00010,
+        0b10010,
+        0b01100,
+        0b00000,
+    ],
+    "4": [
+        5,
+        0b00010,
+        0b00110,
+        0b01010,
+        0b10010,
+        0b11110,
+        0b00010,
+        0b00010,
+        0b00000,
+    ],
+    "5": [
+        5,
+        0b11110,
+        0b10000,
+        0b11100,
+        0b00010,
+        0b00010,
+        0b00010,
+        0b11100,
+        0b00000,
+    ],
+    "6": [
+        5,
+        0b00100,
+        0b01000,
+        0b10000,
+        0b11100,
+        0b10010,
+        0b10010,
+        0b01100,
+        0b00000,
+    ],
+    "7": [
+        5,
+        0b11110,
+        0b00010,
+        0b00010,
+        0b00100,
+        0b01000,
+        0b01000,
+        0b01000,
+        0b00000,
+    ],
+    "8": [
+        5,
+        0b01100,
+        0b10010,
+        0b10010,
+        0b01100,
+        0b10010,
+        0b10010,
+        0b01100,
+        0b00000,
+    ],
+    "9": [
+        5,
+        0b01100,
+        0b10010,
+        0b10010,
+        0b01110,
+        0b00010,
+        0b00010,
+        0b01100,
+        0b00000,
+    ],
+    "A": [
+        5,
+        0b01100,
+        0b10010,
+        0b10010,
+        0b11110,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b00000,
+    ],
+    "B": [
+        5,
+        0b11100,
+        0b10010,
+        0b10010,
+        0b11100,
+        0b10010,
+        0b10010,
+        0b11100,
+        0b00000,
+    ],
+    "C": [
+        5,
+        0b01100,
+        0b10010,
+        0b10000,
+        0b10000,
+        0b10000,
+        0b10010,
+        0b01100,
+        0b00000,
+    ],
+    "D": [
+        5,
+        0b11100,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b11100,
+        0b00000,
+    ],
+    "E": [
+        5,
+        0b11110,
+        0b10000,
+        0b10000,
+        0b11100,
+        0b10000,
+        0b10000,
+        0b11110,
+        0b00000,
+    ],
+    "F": [
+        5,
+        0b11110,
+        0b10000,
+        0b10000,
+        0b11100,
+        0b10000,
+        0b10000,
+        0b10000,
+        0b00000,
+    ],
+    "G": [
+        5,
+        0b01110,
+        0b10000,
+        0b10000,
+        0b10110,
+        0b10010,
+        0b10010,
+        0b01110,
+        0b00000,
+    ],
+    "H": [
+        5,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b11110,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b00000,
+    ],
+    "I": [
+        4,
+        0b1110,
+        0b0100,
+        0b0100,
+        0b0100,
+        0b0100,
+        0b0100,
+        0b1110,
+        0b0000,
+    ],
+    "J": [
+        5,
+        0b11110,
+        0b00010,
+        0b00010,
+        0b00010,
+        0b00010,
+        0b00010,
+        0b11100,
+        0b00000,
+    ],
+    "K": [
+        5,
+        0b10010,
+        0b10010,
+        0b10100,
+        0b11000,
+        0b10100,
+        0b10010,
+        0b10010,
+        0b00000,
+    ],
+    "L": [
+        5,
+        0b10000,
+        0b10000,
+        0b10000,
+        0b10000,
+        0b10000,
+        0b10000,
+        0b11110,
+        0b00000,
+    ],
+    "M": [
+        6,
+        0b100010,
+        0b110110,
+        0b101010,
+        0b100010,
+        0b100010,
+        0b100010,
+        0b100010,
+        0b000000,
+    ],
+    "N": [
+        5,
+        0b10010,
+        0b10010,
+        0b11010,
+        0b10110,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b00000,
+    ],
+    "O": [
+        5,
+        0b01100,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b01100,
+        0b00000,
+    ],
+    "P": [
+        5,
+        0b11100,
+        0b10010,
+        0b10010,
+        0b11100,
+        0b10000,
+        0b10000,
+        0b10000,
+        0b00000,
+    ],
+    "Q": [
+        5,
+        0b01100,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b01110,
+        0b00010,
+    ],
+    "R": [
+        5,
+        0b11100,
+        0b10010,
+        0b10010,
+        0b11100,
+        0b10100,
+        0b10010,
+        0b10010,
+        0b00000,
+    ],
+    "S": [
+        5,
+        0b01110,
+        0b10000,
+        0b10000,
+        0b01100,
+        0b00010,
+        0b00010,
+        0b11100,
+        0b00000,
+    ],
+    "T": [
+        6,
+        0b111110,
+        0b001000,
+        0b001000,
+        0b001000,
+        0b001000,
+        0b001000,
+        0b001000,
+        0b000000,
+    ],
+    "U": [
+        5,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b01100,
+        0b00000,
+    ],
+    "V": [
+        6,
+        0b100010,
+        0b100010,
+        0b100010,
+        0b100010,
+        0b100010,
+        0b010100,
+        0b001000,
+        0b000000,
+    ],
+    "W": [
+        6,
+        0b100010,
+        0b100010,
+        0b100010,
+        0b100010,
+        0b101010,
+        0b101010,
+        0b010100,
+        0b000000,
+    ],
+    "X": [
+        6,
+        0b100010,
+        0b100010,
+        0b010100,
+        0b001000,
+        0b010100,
+        0b100010,
+        0b100010,
+        0b000000,
+    ],
+    "Y": [
+        6,
+        0b100010,
+        0b100010,
+        0b010100,
+        0b001000,
+        0b001000,
+        0b001000,
+        0b001000,
+        0b000000,
+    ],
+    "Z": [
+        5,
+        0b11110,
+        0b00010,
+        0b00010,
+        0b01100,
+        0b10000,
+        0b10000,
+        0b11110,
+        0b00000,
+    ],
+    "Ä": [
+        5,
+        0b10010,
+        0b00000,
+        0b01100,
+        0b10010,
+        0b10010,
+        0b11110,
+        0b10010,
+        0b00000,
+    ],
+    "Ö": [
+        6,
+        0b10010,
+        0b00000,
+        0b01100,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b01100,
+        0b00000,
+    ],
+    "Ü": [
+        6,
+        0b10010,
+        0b00000,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b01100,
+        0b00000,
+    ],
+    "a": [
+        5,
+        0b00000,
+        0b00000,
+        0b01100,
+        0b00010,
+        0b01110,
+        0b10010,
+        0b01110,
+        0b00000,
+    ],
+    "b": [
+        5,
+        0b10000,
+        0b10000,
+        0b10100,
+        0b11010,
+        0b10010,
+        0b10010,
+        0b11100,
+        0b00000,
+    ],
+    "c": [
+        4,
+        0b0000,
+        0b0000,
+        0b0110,
+        0b1000,
+        0b1000,
+        0b1000,
+        0b0110,
+        0b0000,
+    ],
+    "d": [
+        5,
+        0b00010,
+        0b00010,
+        0b01010,
+        0b10110,
+        0b10010,
+        0b10010,
+        0b01110,
+        0b00000,
+    ],
+    "e": [
+        5,
+        0b00000,
+        0b00000,
+        0b01100,
+        0b10010,
+        0b11110,
+        0b10000,
+        0b01100,
+        0b00000,
+    ],
+    "é": [
+        5,
+        0b00100,
+        0b01000,
+        0b01100,
+        0b10010,
+        0b11110,
+        0b10000,
+        0b01100,
+        0b00000,
+    ],
+    "f": [
+        4,
+        0b0011,
+        0b0100,
+        0b0100,
+        0b1110,
+        0b0100,
+        0b0100,
+        0b0100,
+        0b0000,
+    ],
+    "g": [
+        5,
+        0b00000,
+        0b00000,
+        0b01110,
+        0b10010,
+        0b10010,
+        0b01110,
+        0b00010,
+        0b01100,
+    ],
+    "h": [
+        5,
+        0b10000,
+        0b10000,
+        0b10100,
+        0b11010,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b00000,
+    ],
+    "i": [
+        4,
+        0b0100,
+        0b0000,
+        0b1100,
+        0b0100,
+        0b0100,
+        0b0100,
+        0b1110,
+        0b0000,
+    ],
+    "j": [
+        4,
+        0b0010,
+        0b0000,
+        0b0110,
+        0b0010,
+        0b0010,
+        0b0010,
+        0b0010,
+        0b1100,
+    ],
+    "k": [
+        5,
+        0b10000,
+        0b10000,
+        0b10010,
+        0b10100,
+        0b11000,
+        0b10100,
+        0b10010,
+        0b00000,
+    ],
+    "l": [
+        4,
+        0b1100,
+        0b0100,
+        0b0100,
+        0b0100,
+        0b0100,
+        0b0100,
+        0b1110,
+        0b0000,
+    ],
+    "m": [
+        6,
+        0b000000,
+        0b000000,
+        0b110100,
+        0b101010,
+        0b101010,
+        0b101010,
+        0b101010,
+        0b000000,
+    ],
+    "n": [
+        5,
+        0b00000,
+        0b00000,
+        0b10100,
+        0b11010,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b00000,
+    ],
+    "o": [
+        5,
+        0b00000,
+        0b00000,
+        0b01100,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b01100,
+        0b00000,
+    ],
+    "p": [
+        5,
+        0b00000,
+        0b00000,
+        0b11100,
+        0b10010,
+        0b10010,
+        0b11010,
+        0b10100,
+        0b10000,
+    ],
+    "q": [
+        5,
+        0b00000,
+        0b00000,
+        0b01110,
+        0b10010,
+        0b10010,
+        0b01110,
+        0b00010,
+        0b00010,
+    ],
+    "r": [
+        4,
+        0b0000,
+        0b0000,
+        0b1010,
+        0b1100,
+        0b1000,
+        0b1000,
+        0b1000,
+        0b0000,
+    ],
+    "s": [
+        5,
+        0b00000,
+        0b00000,
+        0b01100,
+        0b10000,
+        0b01100,
+        0b00010,
+        0b01100,
+        0b00000,
+    ],
+    "ß": [
+        5,
+        0b01000,
+        0b10100,
+        0b11000,
+        0b10100,
+        0b10010,
+        0b10010,
+        0b11100,
+        0b10000,
+    ],
+    "t": [
+        4,
+        0b0100,
+        0b0100,
+        0b1110,
+        0b0100,
+        0b0100,
+        0b0100,
+        0b0010,
+        0b0000,
+    ],
+    "u": [
+        5,
+        0b00000,
+        0b00000,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b01100,
+        0b00000,
+    ],
+    "v": [
+        5,
+        0b00000,
+        0b00000,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b10100,
+        0b01000,
+        0b000000,
+    ],
+    "w": [
+        6,
+        0b000000,
+        0b000000,
+        0b100010,
+        0b100010,
+        0b101010,
+        0b101010,
+        0b010100,
+        0b000000,
+    ],
+    "x": [
+        5,
+        0b00000,
+        0b00000,
+        0b10010,
+        0b10010,
+        0b01100,
+        0b10010,
+        0b10010,
+        0b00000,
+    ],
+    "y": [
+        5,
+        0b00000,
+        0b00000,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b01110,
+        0b00100,
+        0b11000,
+    ],
+    "z": [
+        5,
+        0b00000,
+        0b00000,
+        0b11110,
+        0b00010,
+        0b01100,
+        0b10000,
+        0b11110,
+        0b00000,
+    ],
+    "ä": [
+        6,
+        0b10010,
+        0b00000,
+        0b01100,
+        0b00010,
+        0b01110,
+        0b10010,
+        0b01110,
+        0b00000,
+    ],
+    "ö": [
+        6,
+        0b10010,
+        0b00000,
+        0b01100,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b01100,
+        0b00000,
+    ],
+    "ü": [
+        5,
+        0b10010,
+        0b00000,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b10010,
+        0b01100,
+        0b00000,
+    ],
+    "-": [
+        4,
+        0b0000,
+        0b0000,
+        0b0000,
+        0b1110,
+        0b0000,
+        0b0000,
+        0b0000,
+        0b0000,
+    ],
+    "–": [
+        5,
+        0b00000,
+        0b00000,
+        0b00000,
+        0b00000,
+        0b11110,
+        0b00000,
+        0b00000,
+        0b00000,
+    ],
+    ".": [
+        2,
+        0b00,
+        0b00,
+        0b00,
+        0b00,
+        0b00,
+        0b00,
+        0b10,
+        0b00,
+    ],
+    "'": [
+        2,
+        0b10,
+        0b10,
+        0b00,
+        0b00,
+        0b00,
+        0b00,
+        0b00,
+        0b00,
+    ],
+    ",": [
+        3,
+        0b000,
+        0b000,
+        0b000,
+        0b000,
+        0b000,
+        0b010,
+        0b010,
+        0b100,
+    ],
+    "+": [
+        4,
+        0b0000,
+        0b0000,
+        0b0100,
+        0b1110,
+        0b0100,
+        0b0000,
+        0b0000,
+        0b0000,
+    ],
+    ":": [
+        2,
+        0b00,
+        0b00,
+        0b00,
+        0b10,
+        0b00,
+        0b00,
+        0b10,
+        0b00,
+    ],
+    "*": [
+        6,
+        0b000000,
+        0b001000,
+        0b101010,
+        0b011100,
+        0b101010,
+        0b001000,
+        0b000000,
+        0b000000,
+    ],
+    "/": [
+        4,
+        0b0000,
+        0b0010,
+        0b0010,
+        0b0100,
+        0b0100,
+        0b1000,
+        0b1000,
+        0b0000,
+    ],
+    "?": [
+        5,
+        0b01100,
+        0b10010,
+        0b00010,
+        0b00100,
+        0b01000,
+        0b00000,
+        0b01000,
+        0b00000,
+    ],
+    "!": [
+        2,
+        0b10,
+        0b10,
+        0b10,
+        0b10,
+        0b10,
+        0b00,
+        0b10,
+        0b00,
+    ],
+    "_": [
+        5,
+        0b00000,
+        0b00000,
+        0b00000,
+        0b00000,
+        0b00000,
+        0b00000,
+        0b11110,
+        0b00000,
+    ],
+    "(": [
+        4,
+        0b0010,
+        0b0100,
+        0b1000,
+        0b1000,
+        0b1000,
+        0b0100,
+        0b0010,
+        0b0000,
+    ],
+    ")": [
+        4,
+        0b1000,
+        0b0100,
+        0b0010,
+        0b0010,
+        0b0010,
+        0b0100,
+        0b1000,
+        0b0000,
+    ],
+    "<": [
+        4,
+        0b0000,
+        0b0010,
+        0b0100,
+        0b1000,
+        0b0100,
+        0b0010,
+        0b0000,
+        0b0000,
+    ],
+    ">": [
+        4,
+        0b0000,
+        0b1000,
+        0b0100,
+        0b0010,
+        0b0100,
+        0b1000,
+        0b0000,
+        0b0000,
+    ],
+    "&": [
+        6,
+        0b011000,
+        0b100100,
+        0b101000,
+        0b010000,
+        0b101010,
+        0b100100,
+        0b011010,
+        0b000000,
+    ],
+    "|": [
+        4,
+        0b0100,
+        0b0000,
+        0b0100,
+        0b0000,
+        0b0100,
+        0b0000,
+        0b0100,
+        0b0000,
+    ],
+    "§": [
+        1,
+        0b0,
+        0b0,
+        0b0,
+        0b0,
+        0b0,
+        0b0,
+        0b0,
+        0b0,
+    ],
+    "*B": [
+        7,
+        0b1111100,
+        0b1100110,
+        0b1100110,
+        0b1111100,
+        0b1100110,
+        0b1100110,
+        0b1111100,
+        0b0000000,
+    ],
+    "*E": [
+        6,
+        0b111110,
+        0b110000,
+        0b110000,
+        0b111100,
+        0b110000,
+        0b110000,
+        0b111110,
+        0b000000,
+    ],
+    "*F": [
+        6,
+        0b111110,
+        0b110000,
+        0b110000,
+        0b111100,
+        0b110000,
+        0b110000,
+        0b110000,
+        0b000000,
+    ],
+    "*M": [
+        8,
+        0b11000110,
+        0b11101110,
+        0b11111110,
+        0b11010110,
+        0b11000110,
+        0b11000110,
+        0b11000110,
+        0b00000000,
+    ],
+    "*N": [
+        7,
+        0b1100110,
+        0b1100110,
+        0b1110110,
+        0b1111110,
+        0b1101110,
+        0b1100110,
+        0b1100110,
+        0b0000000,
+    ],
+    "*R": [
+        7,
+        0b1111100,
+        0b1100110,
+        0b1100110,
+        0b1111100,
+        0b1111000,
+        0b1101100,
+        0b1100110,
+        0b0000000,
+    ],
+    "*S": [
+        7,
+        0b0111110,
+        0b1100000,
+        0b1100000,
+        0b0111100,
+        0b0000110,
+        0b0000110,
+        0b1111100,
+        0b0000000,
+    ],
+    "*U": [
+        7,
+        0b1100110,
+        0b1100110,
+        0b1100110,
+        0b1100110,
+        0b1100110,
+        0b1100110,
+        0b0111100,
+        0b0000000,
+    ],
+    "*X": [
+        7,
+        0b1100110,
+        0b1100110,
+        0b0111100,
+        0b0011000,
+        0b0111100,
+        0b1100110,
+        0b1100110,
+        0b0000000,
+    ],
+    "*0": [
+        7,
+        0b0111100,
+        0b1100110,
+        0b1100110,
+        0b1100110,
+        0b1100110,
+        0b1100110,
+        0b0111100,
+        0b0000000,
+    ],
+    "*1": [
+        7,
+        0b0011000,
+        0b0111000,
+        0b1111000,
+        0b0011000,
+        0b0011000,
+        0b0011000,
+        0b1111110,
+        0b0000000,
+    ],
+    "*2": [
+        7,
+        0b0111100,
+        0b1100110,
+        0b0000110,
+        0b0001100,
+        0b0011000,
+        0b0110000,
+        0b1111110,
+        0b0000000,
+    ],
+    "*3": [
+        7,
+        0b1111110,
+        0b0001100,
+        0b0011000,
+        0b0001100,
+        0b0000110,
+        0b1100110,
+        0b0111100,
+        0b0000000,
+    ],
+    "*4": [
+        7,
+        0b0001100,
+        0b0011100,
+        0b0101100,
+        0b1101100,
+        0b1111110,
+        0b0001100,
+        0b0001100,
+        0b0000000,
+    ],
+    "*5": [
+        7,
+        0b1111110,
+        0b1100000,
+        0b1111100,
+        0b0000110,
+        0b0000110,
+        0b0000110,
+        0b1111100,
+        0b0000000,
+    ],
+    "*6": [
+        7,
+        0b0011100,
+        0b0110000,
+        0b1100000,
+        0b1111100,
+        0b1100110,
+        0b1100110,
+        0b0111100,
+        0b0000000,
+    ],
+    "*7": [
+        7,
+        0b1111110,
+        0b0000110,
+        0b0001100,
+        0b0011000,
+        0b0110000,
+        0b0110000,
+        0b0110000,
+        0b0000000,
+    ],
+    "*8": [
+        7,
+        0b0111100,
+        0b1100110,
+        0b1100110,
+        0b0111100,
+        0b1100110,
+        0b1100110,
+        0b0111100,
+        0b000000,
+    ],
+    "*9": [
+        7,
+        0b0111100,
+        0b1100110,
+        0b1100110,
+        0b0111110,
+        0b0000110,
+        0b0001100,
+        0b0111000,
+        0b0000000,
+    ],
+    "⟳": [
+        12,
+        0b000011100000,
+        0b000100010000,
+        0b001000001000,
+        0b001000101010,
+        0b001000011100,
+        0b000100001000,
+        0b000011100000,
+        0b000000000000,
+    ],
+    "⟲": [
+        10,
+        0b0000111000,
+        0b0001000100,
+        0b0010000010,
+        0b1010100010,
+        0b0111000010,
+        0b0010000100,
+        0b0000111000,
+        0b0000000000,
+    ],
+}
@@ -1,1224 +1,116 @@
-font_small = {
-    "fontheight": 8,
-    " ": [
-        4,
-        0b000,
-        0b000,
-        0b000,
-        0b000,
-        0b000,
-        0b000,
-        0b000,
-        0b000,
-    ],
-    "0": [
-        5,
-        0b01100,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b01100,
-        0b00000,
-    ],
-    "1": [
-        4,
-        0b0100,
-        0b1100,
-        0b0100,
-        0b0100,
-        0b0100,
-        0b0100,
-        0b1110,
-        0b0000,
-    ],
-    "2": [
-        5,
-        0b01100,
-        0b10010,
-        0b00010,
-        0b00100,
-        0b01000,
-        0b10000,
-        0b11110,
-        0b00000,
-    ],
-    "3": [
-        5,
-        0b11110,
-        0b00100,
-        0b01000,
-        0b00100,
-        0b00010,
-        0b10010,
-        0b01100,
-        0b00000,
-    ],
-    "4": [
-        5,
-        0b00010,
-        0b00110,
-        0b01010,
-        0b10010,
-        0b11110,
-        0b00010,
-        0b00010,
-        0b00000,
-    ],
-    "5": [
-        5,
-        0b11110,
-        0b10000,
-        0b11100,
-        0b00010,
-        0b00010,
-        0b00010,
-        0b11100,
-        0b00000,
-    ],
-    "6": [
-        5,
-        0b00100,
-        0b01000,
-        0b10000,
-        0b11100,
-        0b10010,
-        0b10010,
-        0b01100,
-        0b00000,
-    ],
-    "7": [
-        5,
-        0b11110,
-        0b00010,
-        0b00010,
-        0b00100,
-        0b01000,
-        0b01000,
-        0b01000,
-        0b00000,
-    ],
-    "8": [
-        5,
-        0b01100,
-        0b10010,
-        0b10010,
-        0b01100,
-        0b10010,
-        0b10010,
-        0b01100,
-        0b00000,
-    ],
-    "9": [
-        5,
-        0b01100,
-        0b10010,
-        0b10010,
-        0b01110,
-        0b00010,
-        0b00010,
-        0b01100,
-        0b00000,
-    ],
-    "A": [
-        5,
-        0b01100,
-        0b10010,
-        0b10010,
-        0b11110,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b00000,
-    ],
-    "B": [
-        5,
-        0b11100,
-        0b10010,
-        0b10010,
-        0b11100,
-        0b10010,
-        0b10010,
-        0b11100,
-        0b00000,
-    ],
-    "C": [
-        5,
-        0b01100,
-        0b10010,
-        0b10000,
-        0b10000,
-        0b10000,
-        0b10010,
-        0b01100,
-        0b00000,
-    ],
-    "D": [
-        5,
-        0b11100,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b11100,
-        0b00000,
-    ],
-    "E": [
-        5,
-        0b11110,
-        0b10000,
-        0b10000,
-        0b11100,
-        0b10000,
-        0b10000,
-        0b11110,
-        0b00000,
-    ],
-    "F": [
-        5,
-        0b11110,
-        0b10000,
-        0b10000,
-        0b11100,
-        0b10000,
-        0b10000,
-        0b10000,
-        0b00000,
-    ],
-    "G": [
-        5,
-        0b01110,
-        0b10000,
-        0b10000,
-        0b10110,
-        0b10010,
-        0b10010,
-        0b01110,
-        0b00000,
-    ],
-    "H": [
-        5,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b11110,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b00000,
-    ],
-    "I": [
-        4,
-        0b1110,
-        0b0100,
-        0b0100,
-        0b0100,
-        0b0100,
-        0b0100,
-        0b1110,
-        0b0000,
-    ],
-    "J": [
-        5,
-        0b11110,
-        0b00010,
-        0b00010,
-        0b00010,
-        0b00010,
-        0b00010,
-        0b11100,
-        0b00000,
-    ],
-    "K": [
-        5,
-        0b10010,
-        0b10010,
-        0b10100,
-        0b11000,
-        0b10100,
-        0b10010,
-        0b10010,
-        0b00000,
-    ],
-    "L": [
-        5,
-        0b10000,
-        0b10000,
-        0b10000,
-        0b10000,
-        0b10000,
-        0b10000,
-        0b11110,
-        0b00000,
-    ],
-    "M": [
-        6,
-        0b100010,
-        0b110110,
-        0b101010,
-        0b100010,
-        0b100010,
-        0b100010,
-        0b100010,
-        0b000000,
-    ],
-    "N": [
-        5,
-        0b10010,
-        0b10010,
-        0b11010,
-        0b10110,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b00000,
-    ],
-    "O": [
-        5,
-        0b01100,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b01100,
-        0b00000,
-    ],
-    "P": [
-        5,
-        0b11100,
-        0b10010,
-        0b10010,
-        0b11100,
-        0b10000,
-        0b10000,
-        0b10000,
-        0b00000,
-    ],
-    "Q": [
-        5,
-        0b01100,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b01110,
-        0b00010,
-    ],
-    "R": [
-        5,
-        0b11100,
-        0b10010,
-        0b10010,
-        0b11100,
-        0b10100,
-        0b10010,
-        0b10010,
-        0b00000,
-    ],
-    "S": [
-        5,
-        0b01110,
-        0b10000,
-        0b10000,
-        0b01100,
-        0b00010,
-        0b00010,
-        0b11100,
-        0b00000,
-    ],
-    "T": [
-        6,
-        0b111110,
-        0b001000,
-        0b001000,
-        0b001000,
-        0b001000,
-        0b001000,
-        0b001000,
-        0b000000,
-    ],
-    "U": [
-        5,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b01100,
-        0b00000,
-    ],
-    "V": [
-        6,
-        0b100010,
-        0b100010,
-        0b100010,
-        0b100010,
-        0b100010,
-        0b010100,
-        0b001000,
-        0b000000,
-    ],
-    "W": [
-        6,
-        0b100010,
-        0b100010,
-        0b100010,
-        0b100010,
-        0b101010,
-        0b101010,
-        0b010100,
-        0b000000,
-    ],
-    "X": [
-        6,
-        0b100010,
-        0b100010,
-        0b010100,
-        0b001000,
-        0b010100,
-        0b100010,
-        0b100010,
-        0b000000,
-    ],
-    "Y": [
-        6,
-        0b100010,
-        0b100010,
-        0b010100,
-        0b001000,
-        0b001000,
-        0b001000,
-        0b001000,
-        0b000000,
-    ],
-    "Z": [
-        5,
-        0b11110,
-        0b00010,
-        0b00010,
-        0b01100,
-        0b10000,
-        0b10000,
-        0b11110,
-        0b00000,
-    ],
-    "Ä": [
-        5,
-        0b10010,
-        0b00000,
-        0b01100,
-        0b10010,
-        0b10010,
-        0b11110,
-        0b10010,
-        0b00000,
-    ],
-    "Ö": [
-        6,
-        0b10010,
-        0b00000,
-        0b01100,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b01100,
-        0b00000,
-    ],
-    "Ü": [
-        6,
-        0b10010,
-        0b00000,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b01100,
-        0b00000,
-    ],
-    "a": [
-        5,
-        0b00000,
-        0b00000,
-        0b01100,
-        0b00010,
-        0b01110,
-        0b10010,
-        0b01110,
-        0b00000,
-    ],
-    "b": [
-        5,
-        0b10000,
-        0b10000,
-        0b10100,
-        0b11010,
-        0b10010,
-        0b10010,
-        0b11100,
-        0b00000,
-    ],
-    "c": [
-        4,
-        0b0000,
-        0b0000,
-        0b0110,
-        0b1000,
-        0b1000,
-        0b1000,
-        0b0110,
-        0b0000,
-    ],
-    "d": [
-        5,
-        0b00010,
-        0b00010,
-        0b01010,
-        0b10110,
-        0b10010,
-        0b10010,
-        0b01110,
-        0b00000,
-    ],
-    "e": [
-        5,
-        0b00000,
-        0b00000,
-        0b01100,
-        0b10010,
-        0b11110,
-        0b10000,
-        0b01100,
-        0b00000,
-    ],
-    "é": [
-        5,
-        0b00100,
-        0b01000,
-        0b01100,
-        0b10010,
-        0b11110,
-        0b10000,
-        0b01100,
-        0b00000,
-    ],
-    "f": [
-        4,
-        0b0011,
-        0b0100,
-        0b0100,
-        0b1110,
-        0b0100,
-        0b0100,
-        0b0100,
-        0b0000,
-    ],
-    "g": [
-        5,
-        0b00000,
-        0b00000,
-        0b01110,
-        0b10010,
-        0b10010,
-        0b01110,
-        0b00010,
-        0b01100,
-    ],
-    "h": [
-        5,
-        0b10000,
-        0b10000,
-        0b10100,
-        0b11010,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b00000,
-    ],
-    "i": [
-        4,
-        0b0100,
-        0b0000,
-        0b1100,
-        0b0100,
-        0b0100,
-        0b0100,
-        0b1110,
-        0b0000,
-    ],
-    "j": [
-        4,
-        0b0010,
-        0b0000,
-        0b0110,
-        0b0010,
-        0b0010,
-        0b0010,
-        0b0010,
-        0b1100,
-    ],
-    "k": [
-        5,
-        0b10000,
-        0b10000,
-        0b10010,
-        0b10100,
-        0b11000,
-        0b10100,
-        0b10010,
-        0b00000,
-    ],
-    "l": [
-        4,
-        0b1100,
-        0b0100,
-        0b0100,
-        0b0100,
-        0b0100,
-        0b0100,
-        0b1110,
-        0b0000,
-    ],
-    "m": [
-        6,
-        0b000000,
-        0b000000,
-        0b110100,
-        0b101010,
-        0b101010,
-        0b101010,
-        0b101010,
-        0b000000,
-    ],
-    "n": [
-        5,
-        0b00000,
-        0b00000,
-        0b10100,
-        0b11010,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b00000,
-    ],
-    "o": [
-        5,
-        0b00000,
-        0b00000,
-        0b01100,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b01100,
-        0b00000,
-    ],
-    "p": [
-        5,
-        0b00000,
-        0b00000,
-        0b11100,
-        0b10010,
-        0b10010,
-        0b11010,
-        0b10100,
-        0b10000,
-    ],
-    "q": [
-        5,
-        0b00000,
-        0b00000,
-        0b01110,
-        0b10010,
-        0b10010,
-        0b01110,
-        0b00010,
-        0b00010,
-    ],
-    "r": [
-        4,
-        0b0000,
-        0b0000,
-        0b1010,
-        0b1100,
-        0b1000,
-        0b1000,
-        0b1000,
-        0b0000,
-    ],
-    "s": [
-        5,
-        0b00000,
-        0b00000,
-        0b01100,
-        0b10000,
-        0b01100,
-        0b00010,
-        0b01100,
-        0b00000,
-    ],
-    "ß": [
-        5,
-        0b01000,
-        0b10100,
-        0b11000,
-        0b10100,
-        0b10010,
-        0b10010,
-        0b11100,
-        0b10000,
-    ],
-    "t": [
-        4,
-        0b0100,
-        0b0100,
-        0b1110,
-        0b0100,
-        0b0100,
-        0b0100,
-        0b0010,
-        0b0000,
-    ],
-    "u": [
-        5,
-        0b00000,
-        0b00000,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b01100,
-        0b00000,
-    ],
-    "v": [
-        5,
-        0b00000,
-        0b00000,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b10100,
-        0b01000,
-        0b000000,
-    ],
-    "w": [
-        6,
-        0b000000,
-        0b000000,
-        0b100010,
-        0b100010,
-        0b101010,
-        0b101010,
-        0b010100,
-        0b000000,
-    ],
-    "x": [
-        5,
-        0b00000,
-        0b00000,
-        0b10010,
-        0b10010,
-        0b01100,
-        0b10010,
-        0b10010,
-        0b00000,
-    ],
-    "y": [
-        5,
-        0b00000,
-        0b00000,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b01110,
-        0b00100,
-        0b11000,
-    ],
-    "z": [
-        5,
-        0b00000,
-        0b00000,
-        0b11110,
-        0b00010,
-        0b01100,
-        0b10000,
-        0b11110,
-        0b00000,
-    ],
-    "ä": [
-        6,
-        0b10010,
-        0b00000,
-        0b01100,
-        0b00010,
-        0b01110,
-        0b10010,
-        0b01110,
-        0b00000,
-    ],
-    "ö": [
-        6,
-        0b10010,
-        0b00000,
-        0b01100,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b01100,
-        0b00000,
-    ],
-    "ü": [
-        5,
-        0b10010,
-        0b00000,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b10010,
-        0b01100,
-        0b00000,
-    ],
-    "-": [
-        4,
-        0b0000,
-        0b0000,
-        0b0000,
-        0b1110,
-        0b0000,
-        0b0000,
-        0b0000,
-        0b0000,
-    ],
-    "–": [
-        5,
-        0b00000,
-        0b00000,
-        0b00000,
-        0b00000,
-        0b11110,
-        0b00000,
-        0b00000,
-        0b00000,
-    ],
-    ".": [
-        2,
-        0b00,
-        0b00,
-        0b00,
-        0b00,
-        0b00,
-        0b00,
-        0b10,
-        0b00,
-    ],
-    "'": [
-        2,
-        0b10,
-        0b10,
-        0b00,
-        0b00,
-        0b00,
-        0b00,
-        0b00,
-        0b00,
-    ],
-    ",": [
-        3,
-        0b000,
-        0b000,
-        0b000,
-        0b000,
-        0b000,
-        0b010,
-        0b010,
-        0b100,
-    ],
-    "+": [
-        4,
-        0b0000,
-        0b0000,
-        0b0100,
-        0b1110,
-        0b0100,
-        0b0000,
-        0b0000,
-        0b0000,
-    ],
-    ":": [
-        2,
-        0b00,
-        0b00,
-        0b00,
-        0b10,
-        0b00,
-        0b00,
-        0b10,
-        0b00,
-    ],
-    "*": [
-        6,
-        0b000000,
-        0b001000,
-        0b101010,
-        0b011100,
-        0b101010,
-        0b001000,
-        0b000000,
-        0b000000,
-    ],
-    "/": [
-        4,
-        0b0000,
-        0b0010,
-        0b0010,
-        0b0100,
-        0b0100,
-        0b1000,
-        0b1000,
-        0b0000,
-    ],
-    "?": [
-        5,
-        0b01100,
-        0b10010,
-        0b00010,
-        0b00100,
-        0b01000,
-        0b00000,
-        0b01000,
-        0b00000,
-    ],
-    "!": [
-        2,
-        0b10,
-        0b10,
-        0b10,
-        0b10,
-        0b10,
-        0b00,
-        0b10,
-        0b00,
-    ],
-    "_": [
-        5,
-        0b00000,
-        0b00000,
-        0b00000,
-        0b00000,
-        0b00000,
-        0b00000,
-        0b11110,
-        0b00000,
-    ],
-    "(": [
-        4,
-        0b0010,
-        0b0100,
-        0b1000,
-        0b1000,
-        0b1000,
-        0b0100,
-        0b0010,
-        0b0000,
-    ],
-    ")": [
-        4,
-        0b1000,
-        0b0100,
-        0b0010,
-        0b0010,
-        0b0010,
-        0b0100,
-        0b1000,
-        0b0000,
-    ],
-    "<": [
-        4,
-        0b0000,
-        0b0010,
-        0b0100,
-        0b1000,
-        0b0100,
-        0b0010,
-        0b0000,
-        0b0000,
-    ],
-    ">": [
-        4,
-        0b0000,
-        0b1000,
-        0b0100,
-        0b0010,
-        0b0100,
-        0b1000,
-        0b0000,
-        0b0000,
-    ],
-    "&": [
-        6,
-        0b011000,
-        0b100100,
-        0b101000,
-        0b010000,
-        0b101010,
-        0b100100,
-        0b011010,
-        0b000000,
-    ],
-    "|": [
-        4,
-        0b0100,
-        0b0000,
-        0b0100,
-        0b0000,
-        0b0100,
-        0b0000,
-        0b0100,
-        0b0000,
-    ],
-    "§": [
-        1,
-        0b0,
-        0b0,
-        0b0,
-        0b0,
-        0b0,
-        0b0,
-        0b0,
-        0b0,
-    ],
-    "*B": [
-        7,
-        0b1111100,
-        0b1100110,
-        0b1100110,
-        0b1111100,
-        0b1100110,
-        0b1100110,
-        0b1111100,
-        0b0000000,
-    ],
-    "*E": [
-        6,
-        0b111110,
-        0b110000,
-        0b110000,
-        0b111100,
-        0b110000,
-        0b110000,
-        0b111110,
-        0b000000,
-    ],
-    "*F": [
-        6,
-        0b111110,
-        0b110000,
-        0b110000,
-        0b111100,
-        0b110000,
-        0b110000,
-        0b110000,
-        0b000000,
-    ],
-    "*M": [
-        8,
-        0b11000110,
-        0b11101110,
-        0b11111110,
-        0b11010110,
-        0b11000110,
-        0b11000110,
-        0b11000110,
-        0b00000000,
-    ],
-    "*N": [
-        7,
-        0b1100110,
-        0b1100110,
-        0b1110110,
-        0b1111110,
-        0b1101110,
-        0b1100110,
-        0b1100110,
-        0b0000000,
-    ],
-    "*R": [
-        7,
-        0b1111100,
-        0b1100110,
-        0b1100110,
-        0b1111100,
-        0b1111000,
-        0b1101100,
-        0b1100110,
-        0b0000000,
-    ],
-    "*S": [
-        7,
-        0b0111110,
-        0b1100000,
-        0b1100000,
-        0b0111100,
-        0b0000110,
-        0b0000110,
-        0b1111100,
-        0b0000000,
-    ],
-    "*U": [
-        7,
-        0b1100110,
-        0b1100110,
-        0b1100110,
-        0b1100110,
-        0b1100110,
-        0b1100110,
-        0b0111100,
-        0b0000000,
-    ],
-    "*X": [
-        7,
-        0b1100110,
-        0b1100110,
-        0b0111100,
-        0b0011000,
-        0b0111100,
-        0b1100110,
-        0b1100110,
-        0b0000000,
-    ],
-    "*0": [
-        7,
-        0b0111100,
-        0b1100110,
-        0b1100110,
-        0b1100110,
-        0b1100110,
-        0b1100110,
-        0b0111100,
-        0b0000000,
-    ],
-    "*1": [
-        7,
-        0b0011000,
-        0b0111000,
-        0b1111000,
-        0b0011000,
-        0b0011000,
-        0b0011000,
-        0b1111110,
-        0b0000000,
-    ],
-    "*2": [
-        7,
-        0b0111100,
-        0b1100110,
-        0b0000110,
-        0b0001100,
-        0b0011000,
-        0b0110000,
-        0b1111110,
-        0b0000000,
-    ],
-    "*3": [
-        7,
-        0b1111110,
-        0b0001100,
-        0b0011000,
-        0b0001100,
-        0b0000110,
-        0b1100110,
-        0b0111100,
-        0b0000000,
-    ],
-    "*4": [
-        7,
-        0b0001100,
-        0b0011100,
-        0b0101100,
-        0b1101100,
-        0b1111110,
-        0b0001100,
-        0b0001100,
-        0b0000000,
-    ],
-    "*5": [
-        7,
-        0b1111110,
-        0b1100000,
-        0b1111100,
-        0b0000110,
-        0b0000110,
-        0b0000110,
-        0b1111100,
-        0b0000000,
-    ],
-    "*6": [
-        7,
-        0b0011100,
-        0b0110000,
-        0b1100000,
-        0b1111100,
-        0b1100110,
-        0b1100110,
-        0b0111100,
-        0b0000000,
-    ],
-    "*7": [
-        7,
-        0b1111110,
-        0b0000110,
-        0b0001100,
-        0b0011000,
-        0b0110000,
-        0b0110000,
-        0b0110000,
-        0b0000000,
-    ],
-    "*8": [
-        7,
-        0b0111100,
-        0b1100110,
-        0b1100110,
-        0b0111100,
-        0b1100110,
-        0b1100110,
-        0b0111100,
-        0b000000,
-    ],
-    "*9": [
-        7,
-        0b0111100,
-        0b1100110,
-        0b1100110,
-        0b0111110,
-        0b0000110,
-        0b0001100,
-        0b0111000,
-        0b0000000,
-    ],
-    "⟳": [
-        12,
-        0b000011100000,
-        0b000100010000,
-        0b001000001000,
-        0b001000101010,
-        0b001000011100,
-        0b000100001000,
-        0b000011100000,
-        0b000000000000,
-    ],
-    "⟲": [
-        10,
-        0b0000111000,
-        0b0001000100,
-        0b0010000010,
-        0b1010100010,
-        0b0111000010,
-        0b0010000100,
-        0b0000111000,
-        0b0000000000,
-    ],
-}
+# Generated by tools/fontc.py from fonts/font_bvg.py, do not edit.
+# The font format is described in tools/fontc.py.
+
+font_small = (
+    # atlas
+    (
+        b'\x00\x00\x00>AA>B\x7f@bQIF!EK1\x18\x14\x12\x7fGEE9<JI0\x01q'
+        b'\t\x076II6\x06II>~\t\t~\x7fII6>AA"\x7fAA>\x7fIIA\x7f\t'
+        b'\t\x01>AIy\x7f\x08\x08\x7fA\x7fAAAA?\x7f\x08\x14c\x7f@@@\x7f\x02\x04\x02\x7f\x7f\x04'
+        b'\x08\x7f>AA>\x7f\t\t\x06>AA\xfe\x7f\t\x19fFII1\x01\x01\x7f\x01\x01?@@?\x1f'
+        b' @ \x1f?@0@?c\x14\x08\x14c\x03\x04x\x04\x03qIIGy$$y\x009DD9'
+        b'\x00=@@= TTx\x7fHD88DD8DH\x7f8TT\x188VU\x18\x08~\t\x18'
+        b'\xa4\xa4|\x7f\x08\x04xD}@\x80\x84}\x7f\x10(DA\x7f@|\x04x\x04x|\x08\x04x8DD'
+        b'8\xfc$D8\x18$$\xfc|\x08\x04\x08TT \xfeEJ0\x04?D<@@<<@ \x1c<'
+        b'@0@<l\x10\x10l\x9c\xa0`<dTTL\x00!TTy\x009DD9=@@=\x08\x08'
+        b'\x08\x10\x10\x10\x10@\x03\x80`\x08\x1c\x08H\x14\x08>\x08\x14`\x18\x06\x02Q\t\x06_@@@@\x1c"'
+        b'AA"\x1c\x08\x14""\x14\x086IU"P\x00U\x00\x7f\x7fII\x7f6\x7f\x7fIIA\x7f\x7f\t'
+        b'\t\x01\x7f\x7f\x06\x0c\x06\x7f\x7f\x7f\x7f\x0c\x18\x7f\x7f\x7f\x7f\x199oFFOIIy1?\x7f@@\x7f'
+        b'?cw\x1c\x1cwc>\x7fAA\x7f>DF\x7f\x7f@@BcqYOF!aEO{1\x18'
+        b'\x1c\x12\x7f\x7f\x10GGEE}9<~KIy0\x01qy\r\x07\x036\x7fII\x7f6\x06OI'
+        b'i?\x1e\x00\x00\x1c"AAI\x12<\x10\x08\x08\x10<\x12IAA"\x1c'
+    ),
+    # offsets
+    (
+        b'\x00\x00\x03\x00\x07\x00\n\x00\x0e\x00\x12\x00\x16\x00\x1a\x00\x1e\x00"\x00&\x00*\x00.\x002\x006\x00:\x00'
+        b'>\x00B\x00F\x00J\x00M\x00Q\x00U\x00Y\x00^\x00b\x00f\x00j\x00n\x00r\x00v\x00{\x00'
+        b'\x7f\x00\x84\x00\x89\x00\x8e\x00\x93\x00\x97\x00\x9b\x00\xa0\x00\xa5\x00\xa9\x00\xad\x00\xb0\x00\xb4\x00\xb8\x00\xbc\x00\xbf\x00'
+        b'\xc3\x00\xc7\x00\xca\x00\xcd\x00\xd1\x00\xd4\x00\xd9\x00\xdd\x00\xe1\x00\xe5\x00\xe9\x00\xec\x00\xf0\x00\xf4\x00\xf7\x00\xfb\x00'
+        b"\xff\x00\x04\x01\x08\x01\x0c\x01\x10\x01\x15\x01\x1a\x01\x1e\x01!\x01%\x01&\x01'\x01)\x01,\x01-\x012\x01"
+        b'5\x019\x01:\x01>\x01A\x01D\x01G\x01J\x01O\x01R\x01R\x01X\x01]\x01b\x01i\x01o\x01'
+        b'u\x01{\x01\x81\x01\x87\x01\x8d\x01\x93\x01\x99\x01\x9f\x01\xa5\x01\xab\x01\xb1\x01\xb7\x01\xbd\x01\xc3\x01\xce\x01'
+    ),
+    # widths
+    (
+        b'\x03\x04\x03\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x03\x04\x04\x04\x05\x04\x04\x04\x04\x04\x04\x05\x04'
+        b'\x05\x05\x05\x05\x04\x04\x05\x05\x04\x04\x03\x04\x04\x04\x03\x04\x04\x03\x03\x04\x03\x05\x04\x04\x04\x04\x03\x04\x04\x03\x04\x04'
+        b'\x05\x04\x04\x04\x05\x05\x04\x03\x04\x01\x01\x02\x03\x01\x05\x03\x04\x01\x04\x03\x03\x03\x03\x05\x03\x00\x06\x05\x05\x07\x06\x06'
+        b'\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x0b\t'
+    ),
+    # cmap
+    (
+        b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+        b'\x00Q\xff\xff\xff\xffWJSTNLKGIO\x01\x02\x03\x04\x05\x06\x07\x08\t\nM\xffU\xffVP'
+        b'\xff\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$\xff\xff\xff\xffR'
+        b'\xff()*+,./0123456789:;=>?@ABC\xffX\xff\xff\xff'
+        b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+        b'\xff\xff\xff\xff\xff\xff\xffY\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+        b"\xff\xff\xff\xff%\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff&\xff\xff\xff\xff\xff'\xff\xff<"
+        b'\xff\xff\xff\xffD\xff\xff\xff\xff-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffE\xff\xff\xff\xff\xffF\xff\xff\xff'
+    ),
+    # bold_cmap
+    (
+        b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+        b'\x00Q\xff\xff\xff\xffWJSTNLKGIOcdefghijklM\xffU\xffVP'
+        b'\xff\x0bZ\r\x0e[\\\x11\x12\x13\x14\x15\x16]^\x19\x1a\x1b_`\x1ea !b#$\xff\xff\xff\xffR'
+        b'\xff()*+,./0123456789:;=>?@ABC\xffX\xff\xff\xff'
+        b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+        b'\xff\xff\xff\xff\xff\xff\xffY\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+        b"\xff\xff\xff\xff%\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff&\xff\xff\xff\xff\xff'\xff\xff<"
+        b'\xff\xff\xff\xffD\xff\xff\xff\xff-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffE\xff\xff\xff\xff\xffF\xff\xff\xff'
+    ),
+    # cmap_ext
+    {0x2013: 72, 0x27f3: 109, 0x27f2: 110},
+    # kern_pairs
+    (
+        b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\x9f\xff\xfd\xff\xe7\xfb\x7f\xfe\xff\xaf\xb7\xfe\xff\xaf'
+        b'\xcd\xcf\x7f\xf5\x93\xaa5\xff\xdf\xc2\xff\xff\xff\xff\xe7\xff\xff\xff\xd9\xff\x9f\xff\xff\xeb\xff\xff\xff\xff\xf3\xbf\xff\xfd'
+        b'|\xff\xcf\xff\xff\xf5\xff\xff\xff\xff\xf9\xff\xff\x7f\xfe\xff\xe7\xff\xff\xfa\xff\xff\xff\xff\xfc\xef\xff?\xdf\xff\xf3\xff'
+        b'\x7f\xfd\xf5\xff\x7fo\xfe\xf7\xbf\x9f\xe7\xfd\xf9\xff\x97\xfe\xff\xff\xff?\xfe\xfb\xff\xcft\xfb\xfc\xff_\xff\xff\xff'
+        b'\xff\x9f\xff\xfd\xff\xe7\xfb\x7f\xfe\xff\xaf\xff\xff\xff\xff\xcf\xff\xfe\xff\xf3\xfd?\xff\xff\xd7\xff\xff\xff\xff\xe7\xff\xff'
+        b'\xff\xf9\xff\x9f\xff\xff\xeb\xff\xff\xff\xff\xf3\xbf\xff\xff|\xff\xcf\xff\xff\xf5\xff\xff\xff\xff\xf9\xdd\xbf\x7f:\xff\xe6'
+        b'\xff\xff\xf8\xff\xff\xff\xff\xfc\xef\xff?\xdf\xff\xf3\xff\x7f\xbd\xff\xff\xff\x7f~\xfe\xab\x9f\\\xaf\xf9\xff>^\xff'
+        b'\xff\xff?\x02\x19\x10@\x04\xd3\xfco\x1d\xff\xff\xff\xff\x9f\xff\xff\xff\xe7\xff\x7f\xfe\xff\xaf\xff\xff\xff\xff\xcf\xff'
+        b'\xff\xff\xf3\xff?\xff\xff\xd7\xfb\xff\xff\xff\xe7\xe7\xbf\xfa\xc9\xf5\x9a\xff\xef\xe3\xff\xff\xff\xff\xf3\xbf\xff\xff|\xff'
+        b'\xcf\xff\xff\xf5\xff\xff\xff\xff\xf9\xfd\xbf\x7fz\xff\xe6\xff\xffx\xeb\xff\xff\xda\xfc\xfcW?\xa9Z\xf3\xff-\xfc'
+        b'\xff\xff\xff\x7f\xfe\xff\xff\x9f\xff\xff\xf9\xff\xbf\xfe\xff\xff\xff?\xff\xff\xff\xcf\xff\xff\xfc\xff_\xff\xff\xff\xff\x9f'
+        b'\xff\xfd\xff\xe7\xfb\x7f\xfe\xff\xaf\xff\xff\xff\xff\x8f\xff\xfe\xff3\xdd>\xff\xff\xd7\xff\xff\xff\xff\xe7\xff\xff\xff\xf9'
+        b'\xff\x9f\xff\xff\xeb\xff\xff\xff\xff\xf3\xff\xff\xff\xfc\xff\xcf\xff\xff\xf5\xff\xff\xff\xff\xf9\xdf\xff~\xbe\xff\xe7\xff\xff'
+        b'z\xfd\xff\xff\xff\x08d@\x00\x11L\xf3\xbfu\xfc\xff\xff\xff\x7f\xfe\xf7\xff\x9f\xef\xff\xf9\xff\xbf\xfe\xff\xff\xff'
+        b'?\xff\xfb\xff\xcf\xf5\xfb\xfc\xff_\xff\xff\xff\xff\x9f\xff\xfd\xff\xe7\xfb\x7f\xfe\xff\xaf\xff\xff\xff\xff\xcf\xef\xff\xfd'
+        b'\xd3\xfb7\xff\xff\xc7\xfb\xff\xff\xffG`\xaf\xfe\x89h\x9b\xff\xef\xe3\xff\xff\xff\xff\xf3\xff\xff\xff\xec\xff\xcf\xff'
+        b'\xff\xf5\xff\xff\xff\xff\xf9\xff\xff\x7f\xfe\xff\xe7\xff\xff\xfa\xff\xff\xff\xff\xfc\xef\xff?\xdf\xff\xf3\xff\x7f\xfd\xff\xff'
+        b'\xff\x7f\xfe\xf7\xff\x9f\xef\xff\xf9\xff\xbf\xfe\xfe\xff\xbf7\xff\xff\xff\xcf\xfb\xfe\xfc\xff[\x7f\xff\xff\xdf\x9b\xff\xfd'
+        b'\xff\xe7y\x7f\xfe\xff\xad\xbf\xff\xff\xef\xcf\xff\xff\xff\xb3\xff?\xff\xff\xd6\xff\xff\xff\xff\xe7\xff\xff\xff\xf9\xff\x9f'
+        b'\xff\xff\xab\xef\x7f\xfe{\xf3\xbf\xfe\xff\x1c\xaf\xce\xff\xbd\xd5\xf7?\xff\xbd\xf9_\xff\x7f\x8eW\xe7\xff\xde\xfa\xff'
+        b'\xff\xff\xff\xf8\xef\xff?\xd7\xed\xf3\xff\x7f\xfd\xfd\xff\x7f\x7f\xfe\xff\xff\x9f\xff\xff\xf9\xff\xb7\xfe\xfe\xff\xbf7\xff'
+        b"\xff\xff\xcf\xfb\xfe\xfc\xff[o\xfd\xff_\x9b\x9f\xff\xea'Uk\xfe\xbf\x85\xff\xff\xff\xff\xcf\xff\xff\xff\xf3\xff"
+        b'?\xff\xff\xd7\xdf\xff\xff\xf7\xe7\xff\xff\xff\xd9\xff\x9f\xff\x7f\xeb\xad\xff\xffk\xf3\xf3_\xfd\xa4j\xcd\xff\xb7\xf0'
+        b'\xf7\xff\xff\xbd\xf9\xff\xff\x7f\xde\xf7\xe7\xff\xdf\xfa\xfb\xff\xff\xde\xfc\xff\xff?\xef\xfb\xf3\xffo\xfd\xfd\xff\x7fo'
+        b'\xfe\xf7\xff\x9f\xe7\xfd\xf9\xff\xb7\xfe\xfe\xff\xbf7\xff\xfb\xff\xcf\xf3\xfe\xfc\xff[\x7f\xff\xff\xdf\x9f\xff\xff\xff\xe7'
+        b'\xff\x7f\xfe\xff\xad\xbb\xff\xf9\xef\x8b\xff\xfa\xff3\xdd:\xff\xef\xd6_\xff\xff\xf7\xe6w\xff\xfai\xdc\x9b\xff\x7f'
+        b'\xe1\xaf\xff\xff{\xf3\xbf\xff\xfd<\xef\xcf\xff\xbf\xf4\xf7\xff\xff\xfd\xf9\xff\xff\x7f\xf6\xff\xe7\xff\xdf\xfa\xfb\xff\xff'
+        b'\xfe\xfc\xef\xff?\xdf\xff\xf3\xffo\xfd\xfd\xcf\x7f\x7f\xfe\xd7\xff\x9f\xeb\xd7\xf9\xff\xb7\xfe\xfe\xff\xbf?\xff\xfb\xff'
+        b'\xcf\xf7\xff\xfc\xff[\x7f\xff\xff\xdf\x9f\xff\xff\xff\xe7\xff\x7f\xfe\xff\xad\xbf\xff\xff\xef\xcf\xff\xfe\xff\xf3\xfd?\xff'
+        b'\xff\xd6\xdf\xff\xff\xf7\xe7\xff\xff\xff\xf9\xff\x9f\xff\x7f\xeb\xff\xff\xff\xff\xf3\xff\xff\xff\xfc\xff\xcf\xff\xff\xf5\xff\xff'
+        b'\xff\xff\xf9\xdf\xff\x7f\xbe\xff\xe7\xff\xff\xfa\xff\xff\xff\xff\xfc\xef\xff?\xdf\xff\xf3\xff\x7f\xc5\xfd\xcf\x7fg\xfc\xd7'
+        b"\xff\x9f\xe3T\xf97\xb7\xba\xfa\xe7\x9f7\xff\xe9\xdf\xcf\xf1\xea\xfc\xceJo\xfd\xff_\x9b\x9f\xff\xea'Uk"
+        b'\xfe\xbf\x85\xf7\xff\xff\xff\x8f\xc0^\xfd\x13\xd16\xff\xdf\xc7_\xff\xff\xf7\xe6\xf7\xff\xfai\xdd\x9b\xff\x7f!\xee'
+        b'\x7f\xfe;\xe3\xbf\xfe\xff\x1c\xa7\xca\xbf\xb9\xf5\xf7\xff\xff\xbd\xf9\xff\xff\x7f\xde\xf7\xe7\xff\xdf\xfa\xfb\x9f\xff\xfe\xfc'
+        b'\xaf\xff?\xd7\xaf\xf3\xffo\xfd\xff\xff\xff\x7f\xfc\xf7\xff\x9f\xe9\xf6\xf9\xff\xbf\xfe\xff\xff\xff?\xfe\xfb\xff\xcft'
+        b'\xfb\xfc\xff_\xff\xff\xff\xff\x9f\xff\xff\xff\xe7\xff\x7f\xfe\xff\xaf\xb7\xfe\xff\xaf\xcd\xcf\x7f\xf5\x93\xaa5\xff\xdf\xc2'
+        b'\xfb\xff\xff\xff\xe7\xe7\xbf\xfa\xc9\xf5\x9a\xff\xef\xe3\xef\x7f\xfe\xfb\xf3\xbf\xfe\xff\\\xbf\xce\xff\xbf\xf5\xff\xff\xff\xff'
+        b'\xf9\xdd\xbf\x7f:\xff\xe6\xff\xff\x88\xfb\x9f\xff\xce\xf8\xaf\xff?\xc7\xa9\xf2on\xfd\xf5\xff\x7fo\xfe\xff\xbf\x9f'
+        b'\xf7\xfd\xf9\xff\x97\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+        b'\x80\xff\xff\xff\xff\xcf\xff\xfe\xff\xf3\xfd?\xff\xff\xd7\xfb\xff\xff\xff\xe7\xe7\xbf\xfa\xc9\xf5\x9a\xff\xef\xe3\xf5\xff\xff'
+        b'\xff#\x90\x01\x01D0\xcd\xff\xd6\xf1\xff\xff\xff\xff\xf9\xff\xff\x7f\xfe\xff\xe7\xff\xff\xfa\xff\xff\xff\xff\xfc\xff\xff'
+        b'?\xff\xff\xf3\xff\x7f\xfd\xff\xff\xff\x7f\xfe\xff\xff\x9f\xfd\xff\xf9\xff\xbf\xfe\xff\xff\xff?\xff\xfb\xdf\xcf\xf7\xff\xfc'
+        b'\xff_\xff\xff\xff\xff\x9f\xff\xfd\xff\xe7\xfb\x7f\xfe\xff\xaf\xff\xff\xff\xff\xcf\xef\xff\xfd\xd3\xfb7\xff\xff\xc7\xff\xff'
+        b'\xff\xff\xe7\x7f\xff\xff\xf9\xfe\x9f\xff\xff\xeb\xad\xff\xffk\xf3\xf3_\xfd\xa4j\xcd\xff\xb7\xf0\xff\xff\xff\xff\xf9\xff'
+        b'\xff\x7f\xf6\xff\xe7\xff\xff\xfa\xff\xff\xff\xff\xfc\xef\x7f?\xdf\xff\xf3\xff\x7fu\xf5\xcf?o\xfe\xd3\xbf\x9f\xe3\xd5'
+        b'\xf9\x9d\x95\xfe\xff\xff\xff?\xff\xfb\xff\xcf\xf7\xff\xfc\xff_\x7f\xfd\xff\xdf\x9b\xff\xfd\xef\xe7y\x7f\xfe\xff\xa5\xf7'
+        b'\xff\xff\xff\x8f\xc0^\xfd\x13\xd16\xff\xdf\xc7\xff\xff\xff\xff\xe7\x7f\xff\xff\xf9\xfe\x9f\xff\xff\xeb\xff\xff\xff\xff\xf3'
+        b'\xbf\xff\xff\\\xbf\xcf\xff\xff\x15\xf7?\xff\x9d\xf1_\xff\x7f\x8eS\xe5\xdf\xdc\xfa\xfb\x9f\xff\xfe\xfc\xaf\xff?\xd7'
+        b'\xaf\xf3\xffo\x01'
+    ),
+)
@@ -13,3 +13,11 @@ DISPLAY = DISPLAY_INTERSTATE75_128X64
 
 # COLOR_ORDER = COLOR_ORDER_RGB
 COLOR_ORDER = COLOR_ORDER_RBG
+
+# Bytes of RAM for caching rendered line badges, a badge takes
+# one byte per pixel of the LINE column width
+BADGE_CACHE_BYTES = 1024
+
+# Bytes of RAM for the text of all departure rows, each row takes one
+# byte per pixel of its ETA, LINE and DEST text
+TEXT_ATLAS_BYTES = 2048
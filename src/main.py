@@ -10,33 +10,86 @@ from font_bvg import font_small
 import settings
 import hw_conf
 import gc
+import micropython
 import _thread
 import json
+from array import array
+from collections import OrderedDict
 
 _ETA_WIDTH = const(11)
 
-_TEXT_BUF_SZ = const(512)
-_WARN_BUF_SZ = const(2560)
+_ETA_SPRITES = const(100)
+_ETA_SHEET_SZ = const(_ETA_SPRITES*_ETA_WIDTH)
+# columns the warning ticker draws ahead of the display
+_TICKER_SLACK = const(16)
+_TICKER_WRAP = const(1 << 20)
 _COL_GAP = const(3)
 
+# columns of a row, index of their text
 _S_ETA = const(0)
 _S_LINE = const(1)
 _S_DEST = const(2)
-_S_DEST_SZ = const(3)
-_S_DEST_X = const(4)
-_S_BLINKING = const(5)
+
+# Numbers of a row, in two slots. render_task fills the slot the display
+# thread doesn't read and then flips _R_FRONT to publish it.
+_R_FRONT = const(0)
+# scroll position of DEST and the _N_DEST_GEN it belongs to, kept by the
+# display thread
+_R_DEST_X = const(1)
+_R_DEST_X_GEN = const(2)
+_R_SLOTS = const(3)
+
+# numbers of a slot, index into it
+_N_DEST_SZ = const(0)
+# counted up for each new DEST, to start scrolling it from the beginning
+_N_DEST_GEN = const(1)
+_N_BLINKING = const(2)
+_N_LINE_COL = const(3)
+# strips of the row in the text atlas, offset and size
+_N_ETA_OFF = const(4)
+_N_ETA_SZ = const(5)
+_N_LINE_OFF = const(6)
+_N_LINE_SZ = const(7)
+_N_DEST_OFF = const(8)
+_N_DEST_LEN = const(9)
+# hash of the departure shown in the row
+_N_TRIP = const(10)
+_N_SZ = const(11)
+_R_SZ = const(_R_SLOTS + 2*_N_SZ)
 
 _FRAME_RATE = const(25)
 _DEST_SCROLL_DELAY = const(5)
 _BLINK_DELAY_MS = const(600)
 _FETCH_DELAY = const(10)
+_STATS_INTERVAL = const(6)
 _WARN_DURATION = const(45)
 _WARN_PAUSE = const(30)
 
 _FRAME_DELAY = const(1000//_FRAME_RATE)
+_FRAME_US = const(1000000//_FRAME_RATE)
+# the display thread sleeps until this close to a frame and spins for the rest
+_SPIN_US = const(500)
+# when nothing scrolls or blinks, a frame is drawn at least this often
+_IDLE_DELAY_MS = const(1000)
+# how often the idle display thread looks for changes
+_WAKE_POLL_MS = const(10)
+# the display thread collects when less heap than this is free
+_GC_LOW_FREE = const(16384)
+# a drop of allocated heap by more than this is taken as automatic collection
+_GC_DROP = const(1024)
+# after a collection, low heap only makes the display thread collect again
+# once this much more is allocated, not after every frame
+_GC_REARM = const(4096)
+# For debugging: when not 0, the heap is locked for the display thread while
+# it draws and sends a frame, so any allocation there fails with MemoryError.
+# The heap usage is printed every that many frames.
+_ALLOC_CHECK_FRAMES = const(0)
 _DEST_SCROLL_INIT = const(-_FRAME_RATE*_DEST_SCROLL_DELAY)
 _WARN_CYCLE = const(_WARN_DURATION+_WARN_PAUSE)
 _LINE_MIN_WIDTH = const(13)
+# departures requested per fetch
+_DEPS_MAX = const(14)
+_WIDTH_CACHE_SZ = const(32)
 
 # Colors as tuples (R, G, B)
 _RED = const((120, 0, 0))
@@ -61,13 +114,6 @@ def make_disp():
     mv = memoryview(disp)
     return disp, mv
 
-def make_col(col_w):
-    buf = PicoGraphics(width=col_w, height=8, display=DISPLAY_GENERIC, pen_type=PEN_RGB888)
-    buf.set_pen(0)
-    buf.clear()
-    # (buf, buf_mv, lock, buf_width)
-    return (buf, memoryview(buf))
-
 _disp, _disp_mv = make_disp()
 _disp.set_pen(0)
 _disp.clear()
@@ -85,13 +131,71 @@ _h75.start()
 
 _dimming = 10
 
+# pens by surface and color, for the dimming they were created with
+_pen_cache = {}
+_pen_cache_dimming = 10
+
 @micropython.native
 def set_pen(disp, color):
     """Set pen with dimming applied. Color is (R, G, B) tuple."""
+    global _pen_cache_dimming
     dimming = _dimming
-    if dimming != 10:
-        color = tuple(v * dimming // 10 for v in color)
-    disp.set_pen(disp.create_pen(*color))
+    if _pen_cache_dimming != dimming:
+        _pen_cache.clear()
+        _pen_cache_dimming = dimming
+    # by id, a surface may be a buffer that can't be hashed
+    pens = _pen_cache.get(id(disp))
+    if pens is None:
+        pens = {}
+        _pen_cache[id(disp)] = pens
+    pen = pens.get(color)
+    if pen is None:
+        r, g, b = color
+        if dimming != 10:
+            r = r * dimming // 10
+            g = g * dimming // 10
+            b = b * dimming // 10
+        pen = disp.create_pen(r, g, b)
+        pens[color] = pen
+    disp.set_pen(pen)
+
+@micropython.native
+def pen_rgb888(color):
+    """Return the RGB888 pen word of color (R, G, B) at full brightness."""
+    r, g, b = color
+    return (r << 16) | (g << 8) | b
+
+# Brightness of the rows and the warning, in 1/1000. compose() looks up every
+# color channel in _bright_lut, so a change shows with the next frame.
+_brightness = 1000
+_bright_lut = bytearray(range(256))
+# a change of _dimming fades over this time, in steps that look even
+_FADE_MS = const(2000)
+_FADE_STEPS = const(25)
+_FADE_GAMMA = 2.2
+
+def set_brightness(brightness):
+    """Scale the colors drawn by compose() to brightness/1000."""
+    global _brightness, _bright_lut
+    if brightness == _brightness:
+        return
+    # a new table, the display thread may be reading the old one
+    _bright_lut = bytearray((v * brightness + 500) // 1000 for v in range(256))
+    _brightness = brightness
+
+async def fade_brightness(brightness):
+    """Change the brightness gradually to brightness/1000."""
+    # the eye sees brightness about as a power of 1/gamma of the light
+    x0 = (_brightness / 1000) ** (1 / _FADE_GAMMA)
+    x1 = (brightness / 1000) ** (1 / _FADE_GAMMA)
+    for i in range(1, _FADE_STEPS):
+        x = x0 + (x1 - x0) * i / _FADE_STEPS
+        set_brightness(int(x ** _FADE_GAMMA * 1000 + 0.5))
+        await asyncio.sleep_ms(_FADE_MS // _FADE_STEPS)
+    set_brightness(brightness)
+
+# pen of the ETA, DEST and warning text
+_text_color = pen_rgb888(_BVG)
 
 _console_y = 0
 
@@ -295,275 +399,860 @@ def banner():
         h75.set_pixel(127 - i, pos_y, 0, 0, 0)
 
 
+# colors of the products, and of the subway lines with SUBWAY_COLORS
+_TYPE_COLORS = {
+    "tram": (190, 20, 20),
+    "regional": (190, 20, 20),
+    "bus": (149, 39, 110),
+    "suburban": (0, 141, 79),
+    "subway": (17, 93, 145),
+}
+_SUBWAY_COLORS = {
+    "U1": (125, 173, 76),
+    "U2": (218, 66, 30),
+    "U3": (0, 122, 91),
+    "U4": (240, 215, 34),
+    "U5": (126, 83, 48),
+    "U55": (126, 83, 48),
+    "U6": (140, 109, 171),
+    "U7": (82, 141, 186),
+    "U8": (34, 79, 134),
+    "U9": (243, 121, 29),
+}
+
 @micropython.native
 def typ2col(t, l, subcol):
     """Return color tuple for transport type and line"""
-    if t == "tram" or t == "regional":
-        return (190, 20, 20)
-    elif t == "bus":
-        return (149, 39, 110)
-    elif t == "suburban":
-        return (0, 141, 79)
-    elif t == "subway":
-        if subcol:
-            if l == "U1":
-                return (125, 173, 76)
-            elif l == "U2":
-                return (218, 66, 30)
-            elif l == "U3":
-                return (0, 122, 91)
-            elif l == "U4":
-                return (240, 215, 34)
-            elif l == "U5" or l == "U55":
-                return (126, 83, 48)
-            elif l == "U6":
-                return (140, 109, 171)
-            elif l == "U7":
-                return (82, 141, 186)
-            elif l == "U8":
-                return (34, 79, 134)
-            elif l == "U9":
-                return (243, 121, 29)
-            else:
-                print("Unkown subway:", l)
-        return (17, 93, 145)
-    print("Unkown type:", t)
+    if subcol and t == "subway":
+        col = _SUBWAY_COLORS.get(l)
+        if col:
+            return col
+        print("Unknown subway:", l)
+    col = _TYPE_COLORS.get(t)
+    if col:
+        return col
+    print("Unknown type:", t)
     return _WHITE
 
+# pens of the LINE badges by product and line, for the current settings
+_line_pens = {}
+_LINE_PENS_MAX = const(64)
+
 @micropython.native
-def render_text(s, disp=None, x=0, y=0, bold=False, clip=None, kerning=False):
-    if not s:
-        return 0
-    if not clip:
-        if disp:
-            clip = disp.get_bounds()[0]
+def line_pen(typ, line, bg_col, colored, sub_colors):
+    """Return the RGB888 pen word of the badge of line.
+
+    bg_col is the color of the line from the API or None. Each product and
+    line is looked up only once, until the color settings change.
+    """
+    pens = _line_pens.get(typ)
+    if pens is None:
+        pens = {}
+        _line_pens[typ] = pens
+    pen = pens.get(line)
+    if pen is None:
+        if len(pens) >= _LINE_PENS_MAX:
+            pens.clear()
+        if sub_colors and bg_col:
+            pen = pen_rgb888(bg_col)
+        elif colored:
+            pen = pen_rgb888(typ2col(typ, line, sub_colors))
         else:
-            clip = 0xffff
-    cursor_x = x
-    font = font_small
-    height = font["fontheight"]
-    last_col = 0
-    for char in s:
-        if cursor_x >= clip:
+            pen = pen_rgb888(_BVG)
+        pens[line] = pen
+    return pen
+
+_font_glyphs, _font_offsets, _font_widths, _font_cmap, _font_bold_cmap, _font_ext, _font_kern = font_small
+_glyph_mv = memoryview(_font_glyphs)
+# code points >= 256 as parallel arrays, so the rasterizer can search them
+_font_ext_codes = array("H", _font_ext.keys())
+_font_ext_glyphs = bytes(_font_ext.values())
+
+# render_text flags
+_RT_BOLD = const(1)
+_RT_KERNING = const(2)
+_RT_DRAW = const(4)
+
+_NO_GLYPH = const(0xFF)
+
+_no_buf = bytearray(0)
+
+# Text buffers are 1 bit per pixel masks, one byte per pixel column with bit n
+# being row n, the same layout as the glyph atlas. Colors are only applied by
+# compose() when copying into the display buffer.
+
+@micropython.viper
+def decode_glyph(s, i: int, flags: int) -> int:
+    """decode the character at byte i of s, returns (next i << 8) | glyph"""
+    text = ptr8(s)
+    # decode UTF-8
+    c = text[i]
+    i += 1
+    if c >= 0xF0:
+        c = 0xFFFF
+        i += 3
+    elif c >= 0xE0:
+        c = ((c & 0x0F) << 12) | ((text[i] & 0x3F) << 6) | (text[i + 1] & 0x3F)
+        i += 2
+    elif c >= 0x80:
+        c = ((c & 0x1F) << 6) | (text[i] & 0x3F)
+        i += 1
+    if c < 256:
+        cmap = ptr8(_font_bold_cmap if flags & _RT_BOLD else _font_cmap)
+        return (i << 8) | cmap[c]
+    ext_codes = ptr16(_font_ext_codes)
+    ext_glyphs = ptr8(_font_ext_glyphs)
+    n_ext = int(len(_font_ext_glyphs))
+    k = 0
+    while k < n_ext:
+        if ext_codes[k] == c:
+            return (i << 8) | ext_glyphs[k]
+        k += 1
+    return (i << 8) | _NO_GLYPH
+
+@micropython.viper
+def glyph_span(g: int) -> int:
+    """returns (offset of glyph g in the glyph data << 8) | its width"""
+    # little endian uint16, in bytes that may be unaligned in flash
+    offsets = ptr8(_font_offsets)
+    widths = ptr8(_font_widths)
+    return ((offsets[g << 1] | (offsets[(g << 1) + 1] << 8)) << 8) | widths[g]
+
+@micropython.viper
+def kern_gap(prev: int, g: int) -> int:
+    """returns 1 if glyph g needs a gap after glyph prev, or 0"""
+    kern_pairs = ptr8(_font_kern)
+    bit = prev * int(len(_font_widths)) + g
+    return (kern_pairs[bit >> 3] >> (bit & 7)) & 1
+
+@micropython.viper
+def raster_text(dest, s, x: int, clip: int, flags: int) -> int:
+    """draw s into a text mask, returns the advance in pixels"""
+    d = ptr8(dest)
+    glyphs = ptr8(_glyph_mv)
+    kerning = flags & _RT_KERNING
+    draw = flags & _RT_DRAW
+    # pixels right of the buffer are never drawn, but still count for the advance
+    limit = int(len(dest))
+    if clip < limit:
+        limit = clip
+    n = int(len(s))
+    i = 0
+    cursor = x
+    # previous glyph, for kerning
+    prev = -1
+    while n > 0:
+        n -= 1
+        g = int(decode_glyph(s, i, flags))
+        i = g >> 8
+        g &= 0xFF
+        if cursor >= clip:
             # invisible
             break
-        if bold:
-            glyph = font.get("*" + char)
-        if not bold or glyph == None:
-            glyph = font.get(char)
-        if glyph is None:
-            print("missing character:", char)
+        if g == _NO_GLYPH:
+            # can't happen for normalize_text()ed strings
             continue
-        width = glyph[0] - 1
+        o = int(glyph_span(g))
+        w = o & 0xFF
+        o >>= 8
         if kerning:
-            for row in range(height):
-                # if bold:
-                #     check = glyph[row + 1] >> width and ((last_col & (0b10<<row)) != 0)
-                # else:
-                check = glyph[row + 1] >> width and ((last_col & (0b111<<row)) != 0)
-                if check:
-                    cursor_x += 1
+            if prev >= 0:
+                # add a gap if the glyphs would touch
+                cursor += int(kern_gap(prev, g))
+            prev = g
+        if draw:
+            col = 0
+            while col < w:
+                px = cursor + col
+                if px >= limit:
                     break
-            last_col = 0
-        # if cursor_x + width > clip:
-        #     # don't print partial character
-        #     break
-        if cursor_x + width + 8 <= x:
-            # invisible
-            cursor_x += width
-            continue
-        for row in range(height):
-            byte_val = glyph[row + 1]
-            if kerning:
-                last_col |= (byte_val&2)<<row
-            if not disp:
-                continue
-            for col in range(width):
-                px = cursor_x + col
-                if px >= clip:
-                    # invisible
-                    break
-                if px < x:
-                    # invisible
-                    continue
-                if byte_val & (0x1 << (width - col)):
-                    disp.pixel(px, y + row)
+                # nothing left of the buffer either
+                if px >= 0:
+                    d[px] |= glyphs[o + col]
+                col += 1
         # Move cursor for next character
-        cursor_x += width
+        cursor += w
         if not kerning:
-            cursor_x += 1
-    return cursor_x - x
+            cursor += 1
+    return cursor - x
+
+# warning ticker state, see ticker_fill()
+_TK_POS = const(0)
+_TK_PREV = const(1)
+_TK_HEAD = const(2)
+
+@micropython.viper
+def ticker_fill(ring, text, state, limit: int):
+    """draw text with kerning into the ring buffer up to column limit
+
+    The text repeats endlessly. state holds the byte position in text, the
+    previous glyph and the next column to draw, so drawing continues where
+    the last call stopped. Columns are addressed modulo the ring size, which
+    must be a power of two.
+    """
+    r = ptr8(ring)
+    st = ptr32(state)
+    glyphs = ptr8(_glyph_mv)
+    mask = int(len(ring)) - 1
+    n_bytes = int(len(text))
+    if n_bytes == 0:
+        return
+    i = st[_TK_POS]
+    prev = st[_TK_PREV]
+    head = st[_TK_HEAD]
+    wrap_head = -1
+    while head < limit:
+        if i >= n_bytes:
+            if head == wrap_head:
+                # nothing drawable in text
+                break
+            wrap_head = head
+            # start over, without kerning against the end
+            i = 0
+            prev = _NO_GLYPH
+        g = int(decode_glyph(text, i, 0))
+        i = g >> 8
+        g &= 0xFF
+        if g == _NO_GLYPH:
+            continue
+        if prev != _NO_GLYPH and int(kern_gap(prev, g)):
+            r[head & mask] = 0
+            head += 1
+        prev = g
+        o = int(glyph_span(g))
+        w = o & 0xFF
+        o >>= 8
+        col = 0
+        while col < w:
+            r[(head + col) & mask] = glyphs[o + col]
+            col += 1
+        head += w
+    st[_TK_POS] = i
+    st[_TK_PREV] = prev
+    st[_TK_HEAD] = head
+
+@micropython.native
+def render_text(s, buf=None, x=0, bold=False, clip=None, kerning=False):
+    """Draw s into the text mask buf at x, returns the width in pixels."""
+    if not s:
+        return 0
+    flags = 0
+    if bold:
+        flags |= _RT_BOLD
+    if kerning:
+        flags |= _RT_KERNING
+    if buf:
+        if clip is None:
+            clip = len(buf)
+        return raster_text(buf, s, x, clip, flags | _RT_DRAW)
+    if clip is None:
+        clip = 0xffff
+    return raster_text(_no_buf, s, x, clip, flags)
 
+@micropython.viper
+def clear_cols(buf, start: int, end: int):
+    """clear the columns start to end of a text mask"""
+    p = ptr8(buf)
+    while start < end:
+        p[start] = 0
+        start += 1
 
 @micropython.viper
-def blit(dest: ptr32, src: ptr32, dst_off: uint, dst_width: uint, src_off: uint, src_width: uint, length: uint):
-    """fast copy of 8 lines from a text buffer to the display buffer"""
-    dest = ptr32(uint(dest) + dst_off*4)
-    src = ptr32(uint(src) + src_off*4)
-    src_stop = uint(0)
-    l = uint(length & uint(0xFFFFFFF8))*4
-    r = uint(length & uint(0x7))*4
-    for n in range(8):
-        src_stop = uint(src) + l
-        while uint(src) < src_stop:
-            dest[0] = src[0]
-            dest = ptr32(uint(dest) + 4)
-            src = ptr32(uint(src) + 4)
-            dest[0] = src[0]
-            dest = ptr32(uint(dest) + 4)
-            src = ptr32(uint(src) + 4)
-            dest[0] = src[0]
-            dest = ptr32(uint(dest) + 4)
-            src = ptr32(uint(src) + 4)
-            dest[0] = src[0]
-            dest = ptr32(uint(dest) + 4)
-            src = ptr32(uint(src) + 4)
-            dest[0] = src[0]
-            dest = ptr32(uint(dest) + 4)
-            src = ptr32(uint(src) + 4)
-            dest[0] = src[0]
-            dest = ptr32(uint(dest) + 4)
-            src = ptr32(uint(src) + 4)
-            dest[0] = src[0]
-            dest = ptr32(uint(dest) + 4)
-            src = ptr32(uint(src) + 4)
-            dest[0] = src[0]
-            dest = ptr32(uint(dest) + 4)
-            src = ptr32(uint(src) + 4)
-        src_stop:uint = uint(src) + r
-        while uint(src) < src_stop:
-            dest[0] = src[0]
-            dest = ptr32(uint(dest) + 4)
-            src = ptr32(uint(src) + 4)
-        dest = ptr32(uint(dest) + (dst_width-length)*4)
-        src = ptr32(uint(src) + (src_width-length)*4)
-
-def warn_msg_update(msg=None):
-    global _warn_msg, _warn_msg_sz
-    warn_buf = _warn_buf[0]
-    _warn_msg_sz = 0
-    if msg == None:
-        msg = _warn_msg
+def copy_cols(dest, dst_off: int, src, src_off: int, length: int):
+    """copy length columns between text masks"""
+    d = ptr8(dest)
+    s = ptr8(src)
+    i = 0
+    while i < length:
+        d[dst_off + i] = s[src_off + i]
+        i += 1
+
+
+# text widths by string, one LRU cache per combination of _RT_BOLD|_RT_KERNING
+_width_cache = [OrderedDict() for _ in range(4)]
+_width_hits = 0
+_width_misses = 0
+
+@micropython.native
+def text_width(s, bold=False, kerning=False):
+    """Return the width of s in pixels as render_text() would draw it."""
+    global _width_hits, _width_misses
+    flags = _RT_KERNING if kerning else 0
+    if bold:
+        flags |= _RT_BOLD
+    cache = _width_cache[flags]
+    width = cache.pop(s, None)
+    if width is None:
+        _width_misses += 1
+        width = raster_text(_no_buf, s, 0, 0xffff, flags) if s else 0
+        if len(cache) >= _WIDTH_CACHE_SZ:
+            # evict the least recently used
+            del cache[next(iter(cache))]
     else:
-        if _warn_msg == msg:
-            return
-        _warn_msg = msg
-    if not msg:
+        _width_hits += 1
+    # (re)insert as most recently used
+    cache[s] = width
+    return width
+
+
+# geometry of the frame for compose(), set by the display thread
+_G_WIDTH = const(0)
+_G_ROW_Y0 = const(1)
+_G_ROW_H = const(2)
+_G_LINE_W = const(3)
+_G_DEST_X = const(4)
+_G_DEST_W = const(5)
+_G_SEP = const(6)
+_G_BLINK_HIDE = const(7)
+_G_COLOR = const(8)
+_G_WARN_Y = const(9)
+_G_WARN_X = const(10)
+_G_WARN_ON = const(11)
+# set by compose(), what moves on the panel
+_G_ANIM = const(12)
+# columns drawn while render_task published their row
+_G_OVERLAPS = const(13)
+_G_SZ = const(14)
+
+_ANIM_SCROLL = const(1)
+_ANIM_BLINK = const(2)
+
+# what compose() last drew for each column, to skip unchanged ones
+_L_SRC = const(0)
+_L_X = const(1)
+_L_W = const(2)
+_L_COLOR = const(3)
+_L_SZ = const(4)
+
+@micropython.viper
+def compose(dest, atlas, rows, ring, geom, last) -> int:
+    """draw the columns of all rows and the warning ticker into the display
+
+    Every row is (texts, nums), with the front slot of nums describing the
+    strips of its ETA, LINE and DEST column in the atlas. Scrolling
+    destinations are advanced by one pixel and wrap around internally.
+    Only columns that look different than in the last frame are drawn,
+    returns the number of pixel columns written. geom[_G_ANIM] tells if
+    anything scrolls or blinks.
+    """
+    d = ptr32(dest)
+    g = ptr32(geom)
+    l = ptr32(last)
+    written = 0
+    width = g[_G_WIDTH]
+    color = g[_G_COLOR]
+    lut = ptr8(_bright_lut)
+    blink_hide = g[_G_BLINK_HIDE]
+    n_rows = int(len(rows))
+    anim = 0
+    overlaps = 0
+    front = 0
+    # The ticker went off: clear it now and draw the rows under it again,
+    # it is not drawn at all while it is off.
+    k = (n_rows * 3 + 2) * _L_SZ
+    if g[_G_WARN_ON] == 0 and l[k + _L_W] > 0:
+        l[k + _L_W] = 0
+        p = g[_G_WARN_Y] * width
+        end = p + 8 * width
+        while p < end:
+            d[p] = _BG
+            p += 1
+        written += width
+        row = 0
+        while row < n_rows:
+            y = g[_G_ROW_Y0] + row * g[_G_ROW_H]
+            if y < g[_G_WARN_Y] + 8 and y + 8 > g[_G_WARN_Y]:
+                k = row * 3 * _L_SZ
+                end = k + 3 * _L_SZ
+                while k < end:
+                    l[k] = -1
+                    k += 1
+            row += 1
+    # the columns of all rows, then the warning as last row
+    row = 0
+    col = 0
+    while row <= n_rows:
+        # the segment to draw: source strip of wrap columns starting at
+        # src, drawn w columns wide starting at column x of the strip
+        m = ptr8(atlas)
+        p = 0
+        src = 0
+        x = 0
+        w = 0
+        wrap = 0
+        c = color
+        # width of the area of the column on the display
+        area = 0
+        if row == n_rows:
+            if g[_G_WARN_ON]:
+                area = width
+                m = ptr8(ring)
+                p = g[_G_WARN_Y] * width
+                x = g[_G_WARN_X]
+                w = width
+                wrap = int(len(ring))
+                anim |= _ANIM_SCROLL
+            col = 2
+        else:
+            n = ptr32(rows[row][1])
+            if col == 0:
+                # all columns of the row from the same slot
+                front = _R_SLOTS + n[_R_FRONT] * _N_SZ
+            p = (g[_G_ROW_Y0] + row * g[_G_ROW_H]) * width
+            if col == _S_ETA:
+                area = _ETA_WIDTH
+                p += width - _ETA_WIDTH
+                src = n[front + _N_ETA_OFF]
+                w = n[front + _N_ETA_SZ]
+                wrap = w
+            elif col == _S_LINE:
+                area = g[_G_LINE_W]
+                src = n[front + _N_LINE_OFF]
+                w = n[front + _N_LINE_SZ]
+                if w > area:
+                    w = area
+                wrap = w
+                c = n[front + _N_LINE_COL]
+            else:
+                p += g[_G_DEST_X]
+                src = n[front + _N_DEST_OFF]
+                dest_w = g[_G_DEST_W]
+                area = dest_w
+                dest_sz = n[front + _N_DEST_SZ]
+                wrap = n[front + _N_DEST_LEN]
+                if dest_sz > dest_w:
+                    # scroll, with the separator between end and start
+                    if dest_sz + g[_G_SEP] < wrap:
+                        wrap = dest_sz + g[_G_SEP]
+                    anim |= _ANIM_SCROLL
+                    gen = n[front + _N_DEST_GEN]
+                    if n[_R_DEST_X_GEN] != gen:
+                        # new text, start at its beginning
+                        n[_R_DEST_X_GEN] = gen
+                        n[_R_DEST_X] = _DEST_SCROLL_INIT
+                    x = n[_R_DEST_X]
+                    next_x = x + 1
+                    if next_x == wrap:
+                        next_x = _DEST_SCROLL_INIT
+                    n[_R_DEST_X] = next_x
+                    if x < 0:
+                        x = 0
+                    w = dest_w
+                else:
+                    if dest_sz < wrap:
+                        wrap = dest_sz
+                    w = wrap
+                if n[front + _N_BLINKING]:
+                    anim |= _ANIM_BLINK
+                    if blink_hide:
+                        w = 0
+                if _R_SLOTS + n[_R_FRONT] * _N_SZ != front:
+                    # published while the row was drawn, the locks this
+                    # replaced would have skipped these columns
+                    overlaps += 3
+        if wrap <= 0:
+            w = 0
+        # at the current brightness
+        c = (lut[(c >> 16) & 0xff] << 16) | (lut[(c >> 8) & 0xff] << 8) | lut[c & 0xff]
+        # an unchanged column has area 0 and keeps what it shows
+        k = (row * 3 + col) * _L_SZ
+        if area and (l[k + _L_SRC] != src or l[k + _L_X] != x
+                     or l[k + _L_W] != w or l[k + _L_COLOR] != c):
+            l[k + _L_SRC] = src
+            l[k + _L_X] = x
+            l[k + _L_W] = w
+            l[k + _L_COLOR] = c
+            written += area
+        else:
+            w = 0
+            area = 0
+        end = p + w
+        while p < end:
+            bits = m[src + x]
+            q = p
+            y = 0
+            while y < 8:
+                # color where the bit is set, background otherwise
+                mask = 0 - (bits & 1)
+                d[q] = (c & mask) | (_BG & ~mask)
+                bits >>= 1
+                q += width
+                y += 1
+            p += 1
+            x += 1
+            if x == wrap:
+                x = 0
+        # clear the rest of the area
+        end += area - w
+        while p < end:
+            q = p
+            y = 0
+            while y < 8:
+                d[q] = _BG
+                q += width
+                y += 1
+            p += 1
+        col += 1
+        if col == 3:
+            col = 0
+            row += 1
+    g[_G_ANIM] = anim
+    g[_G_OVERLAPS] = overlaps
+    return written
+
+def make_eta_sheet():
+    """Return a text mask with the ETA strings "" and "1'" to "99'".
+
+    Sprite n starts at n * _ETA_WIDTH and is right-aligned to _ETA_WIDTH.
+    """
+    sheet = bytearray(_ETA_SHEET_SZ)
+    for eta_n in range(1, _ETA_SPRITES):
+        x = eta_n * _ETA_WIDTH
+        eta_s = str(eta_n) + "'"
+        render_text(eta_s, sheet, x + _ETA_WIDTH - text_width(eta_s) + 1, clip=x + _ETA_WIDTH)
+    return sheet
+
+# rasterized LINE columns by (line, width), least recently used first
+_badge_cache = OrderedDict()
+_badge_budget = getattr(hw_conf, "BADGE_CACHE_BYTES", 1024)
+_badge_bytes = 0
+_badge_hits = 0
+_badge_misses = 0
+
+def line_badge(line, width):
+    """Return a text mask with line rendered right-aligned into width pixels."""
+    global _badge_bytes, _badge_hits, _badge_misses
+    key = (line, width)
+    badge = _badge_cache.pop(key, None)
+    if badge is None:
+        _badge_misses += 1
+        badge = bytearray(width)
+        line_size = text_width(line, bold=True, kerning=True)
+        render_text(line, badge, max(width - line_size, 0), bold=True, clip=width, kerning=True)
+        if len(badge) > _badge_budget:
+            return badge
+        _badge_bytes += len(badge)
+        while _badge_bytes > _badge_budget:
+            _badge_bytes -= len(_badge_cache.pop(next(iter(_badge_cache))))
+    else:
+        _badge_hits += 1
+    _badge_cache[key] = badge
+    return badge
+
+# All ETA, LINE and DEST strips of the rows live in one text atlas. A strip
+# is as wide as its text and is released when the row shows something else.
+_atlas_sz = getattr(hw_conf, "TEXT_ATLAS_BYTES", 2048)
+# free blocks (offset, size), sorted by offset
+_atlas_free = [(0, _atlas_sz)]
+_atlas_used = 0
+_atlas_fails = 0
+
+def atlas_alloc(size):
+    """Return the offset of a free strip of size columns in the atlas, or -1."""
+    global _atlas_used, _atlas_fails
+    if size <= 0:
+        return 0
+    free = _atlas_free
+    for k in range(len(free)):
+        off, sz = free[k]
+        if sz >= size:
+            if sz == size:
+                free.pop(k)
+            else:
+                free[k] = (off + size, sz - size)
+            _atlas_used += size
+            return off
+    _atlas_fails += 1
+    return -1
+
+def atlas_release(off, size):
+    """Return a strip from atlas_alloc() to the free blocks."""
+    global _atlas_used
+    if size <= 0:
+        return
+    _atlas_used -= size
+    free = _atlas_free
+    k = 0
+    while k < len(free) and free[k][0] < off:
+        k += 1
+    # merge with the neighbouring free blocks
+    if k < len(free) and off + size == free[k][0]:
+        size += free.pop(k)[1]
+    if k > 0 and free[k-1][0] + free[k-1][1] == off:
+        free[k-1] = (free[k-1][0], free[k-1][1] + size)
+    else:
+        free.insert(k, (off, size))
+
+def atlas_largest():
+    """Return the size of the largest free block of the atlas."""
+    largest = 0
+    for _, sz in _atlas_free:
+        if sz > largest:
+            largest = sz
+    return largest
+
+def warn_msg_update(msg):
+    """Show msg in the warning ticker, or hide the ticker if msg is empty."""
+    global _warn_msg, _warn_text, _warn_seq
+    if _warn_msg == msg:
         return
-    msg_size = render_text(msg, None, kerning=True, clip=None)
-    if msg_size > _WARN_BUF_SZ:
-        print("WARNING: warn message too large:", msg_size)
-    with _warn_buf_lock:
-        warn_buf.set_pen(_BG)
-        warn_buf.clear()
-        set_pen(warn_buf, _BVG)
-        render_text(msg, warn_buf, 0, 0, kerning=True, clip=_WARN_BUF_SZ)
-        _warn_msg_sz = min(msg_size, _WARN_BUF_SZ)
+    _warn_msg = msg
+    # the display thread picks up the new text when it sees the new sequence
+    _warn_text = msg.encode()
+    _warn_seq += 1
     print("updated warn message")
 
 _disp_thread_stop = False
 _disp_thread_lock = _thread.allocate_lock()
 
+# A collection stops both cores. The display thread runs them right after
+# sending a frame, so they take from the time of the next frame only.
+_gc_request = False
+_gc_count = 0
+_gc_auto = 0
+_gc_last_us = 0
+_gc_max_us = 0
+_frames_late = 0
+_frames_late_gc = 0
+# frames that were the same as the one before and not sent again
+_frames_skipped = 0
+# sent bytes in MB and the rest, a plain byte count would be too big for a
+# small int after about an hour and allocate on every frame
+_blit_mb = 0
+_blit_bytes = 0
+# frames not drawn at all because nothing moved, and early wake-ups for changes
+_frames_idle = 0
+_display_wakeups = 0
+# how late frames are sent, average (times 16) and maximum
+_jitter_avg16 = 0
+_jitter_max_us = 0
+# time of compose() and of sending a frame to the panel, the same way
+_compose_avg16 = 0
+_compose_max_us = 0
+_push_avg16 = 0
+_push_max_us = 0
+# counted up after every compose(), render_task waits for it to change
+# before it reuses what the display thread may have still been drawing
+_frame_seq = 0
+_col_overlaps = 0
+
+async def gc_collect():
+    """Have the display thread run gc.collect() after its next frame."""
+    global _gc_request
+    if not _disp_thread_lock.locked():
+        gc.collect()
+        return
+    _gc_request = True
+    while _gc_request and _disp_thread_lock.locked():
+        await asyncio.sleep_ms(_FRAME_DELAY)
+
 _separator = " - "
-_separator_sz = render_text(_separator, kerning=True)
+_separator_sz = text_width(_separator, kerning=True)
+
+@micropython.native
+def sleep_until(t):
+    """Wait until time.ticks_us() reaches t, sleeping most of the time."""
+    while True:
+        left = time.ticks_diff(t, time.ticks_us())
+        if left <= 0:
+            return
+        ms = (left - _SPIN_US) // 1000
+        if ms > 0:
+            time.sleep_ms(ms)
 
 @micropython.native
 def display_thread():
+    global _gc_request, _gc_count, _gc_auto, _gc_last_us, _gc_max_us
+    global _frames_late, _frames_late_gc, _frames_skipped, _blit_mb, _blit_bytes
+    global _frames_idle, _display_wakeups, _jitter_avg16, _jitter_max_us
+    global _frame_seq, _col_overlaps
+    global _compose_avg16, _compose_max_us, _push_avg16, _push_max_us
     print("display_thread started")
-    warn_mv = _warn_buf[1]
-    warn_buf_lock = _warn_buf_lock
     _disp_thread_lock.acquire()
+    heap_locked = False
+    frame = 0
     try:
         # local copies of global vars to avoid lookup
         h75 = _h75
         disp = _disp
         disp_mv = _disp_mv
         disp_width = _disp_width
-        warn_y = _warn_y
-        row_y0 = _row_y0
-        row_h = _row_height
-        textlines = _textlines
-        n_textlines = _n_textlines
-        separator_sz = _separator_sz
-        t1 = time.ticks_ms()
+        atlas = _atlas
+        geom = array("i", [0] * _G_SZ)
+        geom[_G_WIDTH] = disp_width
+        geom[_G_ROW_Y0] = _row_y0
+        geom[_G_ROW_H] = _row_height
+        geom[_G_SEP] = _separator_sz
+        geom[_G_WARN_Y] = _warn_y
+        last = array("i", [-1] * ((_n_textlines + 1) * 3 * _L_SZ))
+        # deadline of the frame in ticks_us()
+        t1 = time.ticks_us()
         t_blink = t1
+        # the warning is drawn just ahead of the scroll position into a ring
+        # buffer a bit wider than the display
+        ring_sz = 1
+        while ring_sz < disp_width + _TICKER_SLACK:
+            ring_sz <<= 1
+        ring_mask = ring_sz - 1
+        ring = bytearray(ring_sz)
+        ticker = array("i", (0, _NO_GLYPH, 0))
+        warn_text = b""
+        warn_seq = -1
         warn_x = 0
-        warn_msg_sz = 0
-        blink_hide = False
-        dest_off = 0
+        blink_hide = 0
+        heap = gc.mem_free() + gc.mem_alloc()
+        alloc_prev = gc.mem_alloc()
+        # allocated heap after the last collection
+        alloc_gc = 0
+        gc_ran = False
+        frame_alloc = alloc_prev
         disp.set_pen(0)
+        disp.clear()
         while not _disp_thread_stop:
-            disp.clear()
+            if _ALLOC_CHECK_FRAMES:
+                micropython.heap_lock()
+                heap_locked = True
             dest_off = _dest_offset
-            line_width = dest_off - _COL_GAP
-            dest_width = disp_width - line_width - _ETA_WIDTH - 2*_COL_GAP
-            for i in range(n_textlines):
-                buf, mv, locks, states = textlines[i]
-                row_y = (row_y0 + i * row_h)
-                row_offset = row_y * disp_width
-                # ETA column
-                if locks[_S_ETA].acquire(False):
-                    blit(disp_mv, mv, row_offset + disp_width - _ETA_WIDTH, disp_width, 0, _TEXT_BUF_SZ, _ETA_WIDTH)
-                    locks[_S_ETA].release()
-                # LINE column
-                if locks[_S_LINE].acquire(False):
-                    blit(disp_mv, mv, row_offset, disp_width, _ETA_WIDTH, _TEXT_BUF_SZ, line_width)
-                    locks[_S_LINE].release()
-                # DEST column
-                if locks[_S_DEST].acquire(False):
-                    dest_sz = states[_S_DEST_SZ]
-                    #print("i:", i, "dest_sz: ", dest_sz, "dest_width:", dest_width)
-                    show = True
-                    if states[_S_BLINKING] and blink_hide:
-                        disp.rectangle(dest_off, row_y, dest_width, 8)
-                        show = False
-                    if dest_sz > dest_width:
-                        dest_sz += min(separator_sz, _TEXT_BUF_SZ - _ETA_WIDTH - line_width - dest_sz)
-                        x = states[_S_DEST_X]
-                        next_x = x+1
-                        if next_x == dest_sz:
-                            next_x = _DEST_SCROLL_INIT
-                        states[_S_DEST_X] = next_x
-                        if x < 0:
-                            x = 0
-                        #print("x: ", x)
-                        if show:
-                            if x > dest_sz-dest_width:
-                                blit(disp_mv, mv, row_offset + dest_off, disp_width, _ETA_WIDTH+line_width+x, _TEXT_BUF_SZ, dest_sz-x)
-                                blit(disp_mv, mv, row_offset + dest_off + dest_sz - x, disp_width, _ETA_WIDTH+line_width, _TEXT_BUF_SZ, dest_width-dest_sz+x)
-                            else:
-                                blit(disp_mv, mv, row_offset + dest_off, disp_width, _ETA_WIDTH+line_width+x, _TEXT_BUF_SZ, dest_width)
-                    elif show:
-                        disp.rectangle(dest_off, row_y, dest_width, 8)
-                        blit(disp_mv, mv, row_offset + dest_off, disp_width, _ETA_WIDTH+line_width, _TEXT_BUF_SZ, dest_sz)
-                    locks[_S_DEST].release()
-            if _warn_msg_sz:
-                warn_buf_lock.acquire()
-                warn_msg_sz = _warn_msg_sz
-                if warn_x >= warn_msg_sz:
-                    warn_x = 0
-                if warn_x > warn_msg_sz-disp_width:
-                    blit(disp_mv, warn_mv, warn_y*disp_width, disp_width, warn_x, _WARN_BUF_SZ, warn_msg_sz-warn_x)
-                    blit(disp_mv, warn_mv, warn_y*disp_width+warn_msg_sz-warn_x, disp_width, 0, _WARN_BUF_SZ, disp_width-warn_msg_sz+warn_x)
-                else:
-                    blit(disp_mv, warn_mv, warn_y*disp_width, disp_width, warn_x, _WARN_BUF_SZ, disp_width)
-                warn_buf_lock.release()
+            if dest_off != geom[_G_DEST_X]:
+                # the columns moved, draw everything again
+                disp.clear()
+                for k in range(len(last)):
+                    last[k] = -1
+                line_width = dest_off - _COL_GAP
+                geom[_G_LINE_W] = line_width
+                geom[_G_DEST_X] = dest_off
+                geom[_G_DEST_W] = disp_width - line_width - _ETA_WIDTH - 2*_COL_GAP
+            geom[_G_BLINK_HIDE] = blink_hide
+            geom[_G_COLOR] = _text_color
+            if warn_seq != _warn_seq:
+                # new message, start over at its beginning
+                warn_seq = _warn_seq
+                warn_text = _warn_text
+                clear_cols(ring, 0, ring_sz)
+                ticker[_TK_POS] = 0
+                ticker[_TK_PREV] = _NO_GLYPH
+                ticker[_TK_HEAD] = 0
+                warn_x = 0
+            if warn_text:
+                ticker_fill(ring, warn_text, ticker, warn_x + disp_width)
+                geom[_G_WARN_X] = warn_x & ring_mask
+                geom[_G_WARN_ON] = 1
+            else:
+                geom[_G_WARN_ON] = 0
+            render_seq = _render_seq
+            bright_lut = _bright_lut
+            # rows can be reordered by render_task between frames
+            t = time.ticks_us()
+            written = compose(disp_mv, atlas, _textlines, ring, geom, last)
+            t = time.ticks_diff(time.ticks_us(), t)
+            _compose_avg16 += t - (_compose_avg16 >> 4)
+            if t > _compose_max_us:
+                _compose_max_us = t
+            _frame_seq = (_frame_seq + 1) & 0xffff
+            if geom[_G_OVERLAPS]:
+                _col_overlaps += geom[_G_OVERLAPS]
+            if warn_text:
                 warn_x += 1
-            elif warn_msg_sz:
-                disp.rectangle(0, warn_y, disp_width, 8)
-                warn_msg_sz = 0
-            if t1 > t_blink:
-                t_blink += _BLINK_DELAY_MS
-                blink_hide = not blink_hide
+                if warn_x >= _TICKER_WRAP:
+                    # keep the column counters small ints
+                    warn_x -= _TICKER_WRAP
+                    ticker[_TK_HEAD] -= _TICKER_WRAP
+            if time.ticks_diff(t1, t_blink) > 0:
+                t_blink = time.ticks_add(t_blink, _BLINK_DELAY_MS * 1000)
+                if time.ticks_diff(t1, t_blink) > 0:
+                    # back from idle, blink from now on
+                    t_blink = time.ticks_add(t1, _BLINK_DELAY_MS * 1000)
+                blink_hide ^= 1
             # elapsed = time.ticks_diff(time.ticks_ms(), t1)
             # print("elapsed", elapsed)
-            # busy loop on core 2 to avoid flickering
-            t1 += _FRAME_DELAY
-            while True:
-                if time.ticks_ms() >= t1:
-                    break
-            h75.update(disp)
+            alloc = gc.mem_alloc()
+            if alloc < alloc_prev - _GC_DROP:
+                # collected on the other core, while allocating
+                _gc_auto += 1
+                gc_ran = True
+                alloc_gc = alloc
+            alloc_prev = alloc
+            t1 = time.ticks_add(t1, _FRAME_US)
+            late = time.ticks_diff(time.ticks_us(), t1) > 0
+            if late:
+                _frames_late += 1
+                if gc_ran:
+                    _frames_late_gc += 1
+            gc_ran = False
+            anim = geom[_G_ANIM]
+            if not anim & _ANIM_SCROLL:
+                # nothing scrolls, look out for changes of the rows, the
+                # warning, the layout or the brightness while waiting, and
+                # for a collection the fetch task waits for
+                while time.ticks_diff(t1, time.ticks_us()) > _WAKE_POLL_MS * 1000:
+                    if (render_seq != _render_seq or warn_seq != _warn_seq
+                            or dest_off != _dest_offset or bright_lut is not _bright_lut
+                            or _gc_request):
+                        _display_wakeups += 1
+                        anim = _ANIM_SCROLL
+                        late = True
+                        t1 = time.ticks_us()
+                        break
+                    time.sleep_ms(_WAKE_POLL_MS)
+            sleep_until(t1)
+            if not late:
+                lag = time.ticks_diff(time.ticks_us(), t1)
+                _jitter_avg16 += lag - (_jitter_avg16 >> 4)
+                if lag > _jitter_max_us:
+                    _jitter_max_us = lag
+            if written:
+                # update() copies the frame into the buffers of the driver,
+                # which shows them by itself, so disp is free again after it
+                t = time.ticks_us()
+                h75.update(disp)
+                t = time.ticks_diff(time.ticks_us(), t)
+                _push_avg16 += t - (_push_avg16 >> 4)
+                if t > _push_max_us:
+                    _push_max_us = t
+                # 8 pixels of 4 bytes per column
+                _blit_bytes += written * 32
+                if _blit_bytes >= 0x100000:
+                    _blit_mb += _blit_bytes >> 20
+                    _blit_bytes &= 0xfffff
+            else:
+                _frames_skipped += 1
+            if _ALLOC_CHECK_FRAMES:
+                micropython.heap_unlock()
+                heap_locked = False
+                frame += 1
+                if frame % _ALLOC_CHECK_FRAMES == 0:
+                    print("alloc check:", frame, "frames ok, heap",
+                          alloc - frame_alloc, "bytes, by both cores")
+                    frame_alloc = alloc
+            if (_gc_request or (heap - alloc < _GC_LOW_FREE
+                                and alloc - alloc_gc > _GC_REARM)):
+                t = time.ticks_us()
+                gc.collect()
+                t = time.ticks_diff(time.ticks_us(), t)
+                _gc_count += 1
+                _gc_last_us = t
+                if t > _gc_max_us:
+                    _gc_max_us = t
+                _gc_request = False
+                gc_ran = True
+                alloc_prev = alloc_gc = gc.mem_alloc()
+            if not anim & _ANIM_SCROLL and blink_hide == geom[_G_BLINK_HIDE]:
+                # The frames up to the next blink look the same as this one,
+                # jump to the frame that toggles it. The frame after that
+                # shows it, as at the full frame rate.
+                skip = (_IDLE_DELAY_MS - _FRAME_DELAY) * 1000
+                if anim & _ANIM_BLINK:
+                    skip = time.ticks_diff(t_blink, t1) + _FRAME_US
+                    skip -= skip % _FRAME_US
+                    if skip < 0:
+                        skip = 0
+                t1 = time.ticks_add(t1, skip)
+                _frames_idle += skip // _FRAME_US
     except Exception as e:
+        # unlocked first, the import and the prints allocate
+        if heap_locked:
+            micropython.heap_unlock()
+            print("alloc check: display thread allocated in frame", frame)
         import sys
         print(f"display thread failed: {e}")
         sys.print_exception(e)
@@ -571,12 +1260,72 @@ def display_thread():
         print("display thread finished")
         _disp_thread_lock.release()
 
-_dep_data = None
+# Departures of the last fetch, as parallel arrays that are reused for every
+# fetch. Strings and colors are ids into the intern table, trips are hashes
+# of the trip ids. _dep_n is -1 until the first fetch.
+_dep_n = -1
+_dep_line = bytearray(_DEPS_MAX)
+_dep_typ = bytearray(_DEPS_MAX)
+_dep_dest = bytearray(_DEPS_MAX)
+_dep_col = bytearray(_DEPS_MAX)
+_dep_when = array("l", [0] * _DEPS_MAX)
+_dep_trip = array("l", [0] * _DEPS_MAX)
+# a fetch fills these and swaps them with the ones above when it is done,
+# so a response that fails halfway leaves the last departures as they were
+_dep_line_b = bytearray(_DEPS_MAX)
+_dep_typ_b = bytearray(_DEPS_MAX)
+_dep_dest_b = bytearray(_DEPS_MAX)
+_dep_col_b = bytearray(_DEPS_MAX)
+_dep_when_b = array("l", [0] * _DEPS_MAX)
+_dep_trip_b = array("l", [0] * _DEPS_MAX)
+# indexes of the departures shown in the rows
+_dep_visible = bytearray(_DEPS_MAX)
+
+def row_front(nums):
+    """Return where the published slot starts in the numbers of a row."""
+    return _R_SLOTS + nums[_R_FRONT] * _N_SZ
+
+def bind_rows(rows, n):
+    """Return rows reordered to show the first n departures of _dep_visible.
+
+    A departure that is already on the display keeps its row, so its text
+    and scroll position are reused. The other departures get the remaining
+    rows in their order, the rows left over go last.
+    """
+    free = list(rows)
+    order = []
+    for k in range(n):
+        trip = _dep_trip[_dep_visible[k]]
+        row = None
+        if trip:
+            for r in free:
+                if r[1][row_front(r[1]) + _N_TRIP] == trip:
+                    row = r
+                    break
+        if row:
+            free.remove(row)
+        order.append(row)
+    for j in range(len(order)):
+        if order[j] is None:
+            order[j] = free.pop(0)
+    return tuple(order + free)
+
 _safe_to_fetch = asyncio.Event()
 _safe_to_fetch.set()
 
+# counted up by render_task whenever the rows change, wakes the display thread
+_render_seq = 0
+# strips replaced by the last update of the rows, released in the next one
+_atlas_deferred = []
+
+async def display_grace(seq):
+    """Wait until the display thread has finished the frame it drew when
+    _frame_seq was seq, and so doesn't use older slots and strips anymore."""
+    while _frame_seq == seq and _disp_thread_lock.locked():
+        await asyncio.sleep_ms(_FRAME_DELAY)
+
 async def render_task():
-    global _dest_offset, _textlines
+    global _dest_offset, _textlines, _render_seq
     print("render task started")
     await asyncio.sleep(5) # give a chance to read the IP address
     start_ms = 0
@@ -584,19 +1333,18 @@ async def render_task():
     sub_colors = False
     print("waiting for first data")
     console("waiting for data...")
-    while _dep_data == None:
+    while _dep_n < 0:
         await asyncio.sleep_ms(100)
     gc.collect()
-    # _textlines[row] structure: ETA|LINE|DEST
-    zero_states = ["", "", "", 0, 0, False]
-    _textlines = []
-    for _ in range(_n_textlines):
-        buf, mv = make_col(_TEXT_BUF_SZ)
-        _textlines.append((
-            buf, mv,
-            (_thread.allocate_lock(), _thread.allocate_lock(),_thread.allocate_lock()),
-            zero_states[:]
-        ))
+    # _textlines[row] structure: texts of ETA|LINE|DEST, numbers
+    _textlines = tuple((["", "", ""], array("i", [0] * _R_SZ)) for _ in range(_n_textlines))
+    published = -1
+    # rows to publish at the end of an update
+    flips = []
+    # strips of the row being rendered, the new ones and the ones they
+    # replace, until the row is added to flips
+    row_new = []
+    row_old = []
 
     _thread.start_new_thread(display_thread, ())
     _safe_to_fetch.clear()
@@ -604,7 +1352,15 @@ async def render_task():
     line_size_max = _LINE_MIN_WIDTH
     while True:
         try:
-            data = _dep_data
+            # the back slots and the strips replaced last time are free
+            # when the display thread is done with them
+            if published >= 0:
+                await display_grace(published)
+                published = -1
+            for off, size in _atlas_deferred:
+                atlas_release(off, size)
+            _atlas_deferred.clear()
+            changed = False
             now = time.time()
             force_update = False
             def update(old, new):
@@ -615,6 +1371,8 @@ async def render_task():
             walk_delay = settings.get("WALK_DELAY")
             colored = update(colored, settings.get("COLORED"))
             sub_colors = update(sub_colors, settings.get("SUBWAY_COLORS"))
+            if force_update:
+                _line_pens.clear()
             if settings.check():
                 line_size_max = _LINE_MIN_WIDTH
             dest_offset = line_size_max + _COL_GAP
@@ -622,99 +1380,170 @@ async def render_task():
                 _dest_offset = dest_offset
                 force_update = True
             line_width = line_size_max
-            i = 0
-            reset_dest_x = []
-            for line, typ, dest, when, bg_col in data:
-                if i >= _n_textlines:
+            n_visible = 0
+            for k in range(_dep_n):
+                if n_visible >= _n_textlines:
                     break
-
-                eta_n = when - now + 45
-                if eta_n < walk_delay:
-                    continue
-
-                eta_n //= 60
-
-                blinking = False
+                if _dep_when[k] - now + 45 >= walk_delay:
+                    _dep_visible[n_visible] = k
+                    n_visible += 1
+            # move the rows with their departures, so rows only need to be
+            # rendered for departures that are new on the display
+            rows = bind_rows(_textlines, n_visible)
+            changed = force_update
+            for j in range(_n_textlines):
+                if rows[j] is not _textlines[j]:
+                    changed = True
+            _textlines = rows
+            for i in range(n_visible):
+                k = _dep_visible[i]
+                line = _intern_vals[_dep_line[k]]
+                typ = _intern_vals[_dep_typ[k]]
+                dest = _intern_vals[_dep_dest[k]]
+                bg_col = _intern_vals[_dep_col[k]]
+                trip = _dep_trip[k]
+                eta_n = (_dep_when[k] - now + 45) // 60
+
+                blinking = 0
                 if eta_n < 1:
                     eta_s = ""
-                    blinking = True
+                    blinking = 1
                 else:
                     eta_s = str(eta_n) + "'"
 
-                line_size = render_text(line, bold=True, kerning=True)
+                line_size = text_width(line, bold=True, kerning=True)
                 line_size_max = max(line_size_max, line_size)
-                line_offset = max(line_width - line_size, 0)
-                eta_size = 0
-                if eta_s:
-                    eta_size = render_text(eta_s)
-
-                tl_buf, _, locks, states = _textlines[i]
-
-                # render ETA at beginning of textline buffer
-                if eta_s != states[_S_ETA] or force_update:
-                    with locks[_S_ETA]:
-                        tl_buf.set_pen(_BG)
-                        tl_buf.rectangle(0, 0, _ETA_WIDTH, 8)
-                        if eta_s:
-                            set_pen(tl_buf, _BVG)
-                            render_text(eta_s, tl_buf, _ETA_WIDTH - eta_size + 1, 0, clip=_ETA_WIDTH)
-                        states[_S_ETA] = eta_s
-                        states[_S_BLINKING] = blinking
+
+                texts, nums = _textlines[i]
+
+                # Each column is drawn into a new strip and the numbers of
+                # the row go to its back slot, which is published with the
+                # other rows at the end. The old strips are released in the
+                # next update, when the display thread can't use them anymore.
+                # Nothing of the row is kept before it is added to flips.
+                eta_t, line_t, dest_t = texts
+                front = row_front(nums)
+                back = _R_SLOTS + (nums[_R_FRONT] ^ 1) * _N_SZ
+                for n in range(_N_SZ):
+                    nums[back + n] = nums[front + n]
+                dirty = False
+
+                # render ETA
+                if eta_s != texts[_S_ETA] or force_update:
+                    off = atlas_alloc(_ETA_WIDTH)
+                    if off >= 0:
+                        if eta_n < _ETA_SPRITES:
+                            sprite = eta_n if eta_s else 0
+                            copy_cols(_atlas, off, _eta_sheet, sprite * _ETA_WIDTH, _ETA_WIDTH)
+                        else:
+                            # right-aligned, but cut off on the right if
+                            # wider than the strip
+                            clear_cols(_atlas, off, off + _ETA_WIDTH)
+                            x = max(off, off + _ETA_WIDTH - text_width(eta_s) + 1)
+                            render_text(eta_s, _atlas, x, clip=off + _ETA_WIDTH)
+                        row_new.append((off, _ETA_WIDTH))
+                        row_old.append((nums[back + _N_ETA_OFF], nums[back + _N_ETA_SZ]))
+                        nums[back + _N_ETA_OFF] = off
+                        nums[back + _N_ETA_SZ] = _ETA_WIDTH
+                        nums[back + _N_BLINKING] = blinking
+                        eta_t = eta_s
+                        dirty = True
                         print(f"updated ETA of line {i}")
 
                 # then render LINE
-                if line != states[_S_LINE] or force_update:
-                    with locks[_S_LINE]:
-                        tl_buf.set_pen(_BG)
-                        tl_buf.rectangle(_ETA_WIDTH, 0, line_width, 8)
-                        if sub_colors and bg_col:
-                            set_pen(tl_buf, bg_col)
-                        elif colored:
-                            set_pen(tl_buf, typ2col(typ, line, sub_colors))
-                        else:
-                            set_pen(tl_buf, _BVG)
-                        render_text(line, tl_buf, _ETA_WIDTH + line_offset, 0, bold=True, clip=_ETA_WIDTH+line_width, kerning=True)
-                        states[_S_LINE] = line
+                if line != texts[_S_LINE] or force_update:
+                    line_col = line_pen(typ, line, bg_col, colored, sub_colors)
+                    off = atlas_alloc(line_width)
+                    if off >= 0:
+                        copy_cols(_atlas, off, line_badge(line, line_width), 0, line_width)
+                        row_new.append((off, line_width))
+                        row_old.append((nums[back + _N_LINE_OFF], nums[back + _N_LINE_SZ]))
+                        nums[back + _N_LINE_OFF] = off
+                        nums[back + _N_LINE_SZ] = line_width
+                        nums[back + _N_LINE_COL] = line_col
+                        line_t = line
+                        dirty = True
                         print(f"updated LINE of line {i}")
 
-                # last is DEST, because it has flexible length
-                if dest != states[_S_DEST] or force_update:
-                    with locks[_S_DEST]:
-                        tl_buf.set_pen(_BG)
-                        tl_buf.rectangle(_ETA_WIDTH + line_width, 0, _TEXT_BUF_SZ - _ETA_WIDTH - line_width, 8)
-                        set_pen(tl_buf, _BVG)
-                        states[_S_DEST_SZ] = render_text(dest + _separator, tl_buf, _ETA_WIDTH + line_width, 0, clip=_TEXT_BUF_SZ - _ETA_WIDTH - line_width, kerning=True) - _separator_sz
-                        states[_S_DEST] = dest
-                        reset_dest_x.append(i)
+                # last is DEST, because it has flexible length. A DEST that
+                # was clipped is drawn again once it fits as a whole.
+                full_len = nums[back + _N_DEST_SZ] + _separator_sz
+                clipped = 0 < nums[back + _N_DEST_LEN] < full_len
+                if (dest != texts[_S_DEST] or force_update
+                        or (clipped and atlas_largest() >= full_len)):
+                    text = dest + _separator
+                    size = text_width(text, kerning=True)
+                    off = atlas_alloc(size)
+                    if off < 0:
+                        # show as much as fits
+                        size = atlas_largest()
+                        if size > 0:
+                            off = atlas_alloc(size)
+                            print("text atlas full, DEST of line", i, "clipped to", size)
+                    if off >= 0:
+                        clear_cols(_atlas, off, off + size)
+                        render_text(text, _atlas, off, clip=off + size, kerning=True)
+                        row_new.append((off, size))
+                        row_old.append((nums[back + _N_DEST_OFF], nums[back + _N_DEST_LEN]))
+                        nums[back + _N_DEST_OFF] = off
+                        nums[back + _N_DEST_LEN] = size
+                        nums[back + _N_DEST_SZ] = text_width(text, kerning=True) - _separator_sz
+                        nums[back + _N_DEST_GEN] = (nums[back + _N_DEST_GEN] + 1) & 0xffff
+                        dest_t = dest
+                        dirty = True
                         print(f"updated DEST of line {i}")
-                i += 1
-
-            for j in reset_dest_x:
-                locks = _textlines[j][2]
-                locks[_S_DEST].acquire()
-            for j in reset_dest_x:
-                states = _textlines[j][3]
-                states[_S_DEST_X] = _DEST_SCROLL_INIT
-            for j in reset_dest_x:
-                locks = _textlines[j][2]
-                locks[_S_DEST].release()
+                    else:
+                        print("text atlas full, DEST of line", i, "not updated")
+                if nums[back + _N_TRIP] != trip:
+                    nums[back + _N_TRIP] = trip
+                    dirty = True
+                if dirty:
+                    texts[_S_ETA] = eta_t
+                    texts[_S_LINE] = line_t
+                    texts[_S_DEST] = dest_t
+                    _atlas_deferred.extend(row_old)
+                    flips.append(nums)
+                row_new.clear()
+                row_old.clear()
 
             # Clear any unused rows
-            for j in range(i, _n_textlines):
-                disp, _, locks, states = _textlines[j]
-                for lock in locks:
-                    lock.acquire()
-                disp.set_pen(_BG)
-                disp.clear()
-                states[:] = zero_states[:]
-                for lock in locks:
-                    lock.release()
+            for j in range(n_visible, _n_textlines):
+                texts, nums = _textlines[j]
+                front = row_front(nums)
+                if (nums[front + _N_ETA_SZ] or nums[front + _N_LINE_SZ]
+                        or nums[front + _N_DEST_LEN] or nums[front + _N_TRIP]):
+                    _atlas_deferred.append((nums[front + _N_ETA_OFF], nums[front + _N_ETA_SZ]))
+                    _atlas_deferred.append((nums[front + _N_LINE_OFF], nums[front + _N_LINE_SZ]))
+                    _atlas_deferred.append((nums[front + _N_DEST_OFF], nums[front + _N_DEST_LEN]))
+                    back = _R_SLOTS + (nums[_R_FRONT] ^ 1) * _N_SZ
+                    for n in range(_N_SZ):
+                        nums[back + n] = 0
+                    # keep counting, for the next DEST of the row
+                    nums[back + _N_DEST_GEN] = nums[front + _N_DEST_GEN]
+                    texts[_S_ETA] = texts[_S_LINE] = texts[_S_DEST] = ""
+                    flips.append(nums)
 
         except Exception as e:
             import sys
             print(f"render task failed: {e}")
             sys.print_exception(e)
-            print("last data:", data)
+            print("departures:", _dep_n)
+            # the row that failed isn't published, its new strips were
+            # never shown
+            for off, size in row_new:
+                atlas_release(off, size)
+            row_new.clear()
+            row_old.clear()
+        # publish all rows at once, so new destinations start to scroll
+        # together
+        for nums in flips:
+            nums[_R_FRONT] ^= 1
+        if flips:
+            published = _frame_seq
+            changed = True
+            flips.clear()
+        if changed:
+            _render_seq += 1
         # print("---")
 
         # Signal fetch task: "I'm done, safe to run now"
@@ -732,6 +1561,64 @@ async def render_task():
 
 _time_set = False
 
+# replacements for characters the font lacks
+_SUBSTITUTES = {
+    "\t": " ", "\u00a0": " ", "\u2007": " ", "\u2009": " ", "\u202f": " ",
+    "\u2018": "'", "\u2019": "'", "\u201a": "'", "\u201b": "'", "\u2032": "'", "`": "'", "\u00b4": "'",
+    "\"": "'", "\u201c": "'", "\u201d": "'", "\u201e": "'", "\u00ab": "<", "\u00bb": ">",
+    "\u2010": "-", "\u2011": "-", "\u2012": "-", "\u2212": "-", "\u2014": "\u2013", "\u2015": "\u2013",
+    "\u2192": ">", "\u2190": "<", "\u2194": "<>", "\u2026": "...", "\u00b7": ".", "\u2022": ".",
+    ";": ",", "[": "(", "]": ")", "{": "(", "}": ")", "=": "-", "~": "-", "#": "Nr.", "%": " Prozent",
+    "\u00c0": "A", "\u00c1": "A", "\u00c2": "A", "\u00c3": "A", "\u00c5": "A", "\u0104": "A", "\u00c6": "AE",
+    "\u00e0": "a", "\u00e1": "a", "\u00e2": "a", "\u00e3": "a", "\u00e5": "a", "\u0105": "a", "\u00e6": "ae",
+    "\u00c7": "C", "\u0106": "C", "\u010c": "C", "\u00e7": "c", "\u0107": "c", "\u010d": "c",
+    "\u00c8": "E", "\u00c9": "E", "\u00ca": "E", "\u00cb": "E", "\u0118": "E", "\u011a": "E",
+    "\u00e8": "e", "\u00ea": "e", "\u00eb": "e", "\u0119": "e", "\u011b": "e",
+    "\u00cc": "I", "\u00cd": "I", "\u00ce": "I", "\u00cf": "I", "\u00ec": "i", "\u00ed": "i", "\u00ee": "i", "\u00ef": "i",
+    "\u0141": "L", "\u0142": "l", "\u00d1": "N", "\u0143": "N", "\u00f1": "n", "\u0144": "n",
+    "\u00d2": "O", "\u00d3": "O", "\u00d4": "O", "\u00d5": "O", "\u00d8": "O",
+    "\u00f2": "o", "\u00f3": "o", "\u00f4": "o", "\u00f5": "o", "\u00f8": "o",
+    "\u0158": "R", "\u0159": "r", "\u015a": "S", "\u0160": "S", "\u015b": "s", "\u0161": "s",
+    "\u00d9": "U", "\u00da": "U", "\u00db": "U", "\u016e": "U", "\u00f9": "u", "\u00fa": "u", "\u00fb": "u", "\u016f": "u",
+    "\u00dd": "Y", "\u00fd": "y", "\u00ff": "y",
+    "\u0179": "Z", "\u017b": "Z", "\u017d": "Z", "\u017a": "z", "\u017c": "z", "\u017e": "z",
+}
+
+_missing_glyphs = 0
+_missing_glyph_last = 0
+
+@micropython.native
+def has_glyph(ch):
+    c = ord(ch)
+    if c < 256:
+        return _font_cmap[c] != _NO_GLYPH
+    return c in _font_ext
+
+@micropython.native
+def normalize_text(s):
+    """Return s with every character the font lacks substituted or dropped.
+
+    Strings that are fully covered by the font are returned as they are.
+    """
+    global _missing_glyphs, _missing_glyph_last
+    for ch in s:
+        if not has_glyph(ch):
+            break
+    else:
+        return s
+    out = []
+    for ch in s:
+        if has_glyph(ch):
+            out.append(ch)
+            continue
+        sub = _SUBSTITUTES.get(ch)
+        if sub is None:
+            _missing_glyphs += 1
+            _missing_glyph_last = ord(ch)
+            continue
+        out.append(sub)
+    return "".join(out)
+
 @micropython.native
 def parse_color(s):
     if not s:
@@ -743,15 +1630,170 @@ def parse_color(s):
         r, g, b = int(s[0:2], 16), int(s[2:4], 16), int(s[4:6], 16)
     return (r, g, b)
 
+# TEXT_RULES setting as tuple of (old, new) pairs
+_text_rules = ()
+_text_rules_src = None
+
+def load_text_rules():
+    """Update _text_rules from the settings, returns True if they changed."""
+    global _text_rules, _text_rules_src
+    src = settings.get("TEXT_RULES")
+    if src is _text_rules_src:
+        return False
+    _text_rules_src = src
+    rules = []
+    for rule in src or ():
+        if (isinstance(rule, (list, tuple)) and len(rule) == 2
+                and isinstance(rule[0], str) and isinstance(rule[1], str) and rule[0]):
+            rules.append((rule[0], rule[1]))
+        else:
+            print("invalid text rule:", rule)
+    _text_rules = tuple(rules)
+    return True
+
+def clean_text(text):
+    for old, new in _text_rules:
+        text = text.replace(old, new)
+    text = normalize_text(text)
+    text = text.replace("  ", " ")
+    return text.strip()
+
+# The values of departures and warnings are interned: each distinct API
+# string is cleaned up only once and the departures refer to the result by
+# its id. Values that were not used for _INTERN_KEEP fetches are forgotten,
+# but never the ones of the departures that are shown.
+_I_LINE = const(0)
+_I_TYP = const(1)
+_I_DEST = const(2)
+_I_COL = const(3)
+_I_WARN = const(4)
+_I_FREE = const(0xFF)
+# four values per departure and two per warning must fit, for the shown
+# departures and for the fetch that replaces them
+_INTERN_SZ = const(128)
+_INTERN_KEEP = const(6)
+
+# API string -> id, one dict per kind
+_intern_ids = ({}, {}, {}, {}, {})
+_intern_keys = [None] * _INTERN_SZ
+_intern_vals = [None] * _INTERN_SZ
+_intern_kind = bytearray(b"\xff" * _INTERN_SZ)
+_intern_used = array("l", [0] * _INTERN_SZ)
+# 1 for the values of the published departures
+_intern_pin = bytearray(_INTERN_SZ)
+_intern_epoch = 0
+_intern_hits = 0
+_intern_misses = 0
+
+def intern_value(kind, raw):
+    """Return the cleaned up value of the API string raw."""
+    if kind == _I_LINE:
+        return normalize_text(raw)
+    if kind == _I_DEST:
+        return clean_text(raw)
+    if kind == _I_WARN:
+        # only the first line of a warning is shown
+        return clean_text(raw.split("\n")[0])
+    if kind == _I_COL:
+        return parse_color(raw)
+    return raw
+
+def intern(kind, raw):
+    """Return the id of the cleaned up value of the API string raw."""
+    global _intern_hits, _intern_misses
+    ids = _intern_ids[kind]
+    i = ids.get(raw)
+    if i is None:
+        _intern_misses += 1
+        val = intern_value(kind, raw)
+        # take a free slot, or the least recently used one. Slots used
+        # by this fetch or by the shown departures are still needed.
+        i = -1
+        for j in range(_INTERN_SZ):
+            if _intern_kind[j] == _I_FREE:
+                i = j
+                break
+            if (_intern_used[j] != _intern_epoch and not _intern_pin[j]
+                    and (i < 0 or _intern_used[j] < _intern_used[i])):
+                i = j
+        if i < 0:
+            raise RuntimeError("intern table full")
+        if _intern_kind[i] != _I_FREE:
+            del _intern_ids[_intern_kind[i]][_intern_keys[i]]
+        ids[raw] = i
+        _intern_keys[i] = raw
+        _intern_vals[i] = val
+        _intern_kind[i] = kind
+    else:
+        _intern_hits += 1
+    _intern_used[i] = _intern_epoch
+    return i
+
+def intern_expire():
+    """Start a new fetch and forget the values not used recently.
+
+    Cleaned up texts are all cleaned up again when the text rules have
+    changed, in place, as the shown departures still refer to them.
+    """
+    global _intern_epoch
+    _intern_epoch += 1
+    rules_changed = load_text_rules()
+    for i in range(_INTERN_SZ):
+        kind = _intern_kind[i]
+        if kind == _I_FREE:
+            continue
+        if _intern_epoch - _intern_used[i] > _INTERN_KEEP and not _intern_pin[i]:
+            del _intern_ids[kind][_intern_keys[i]]
+            _intern_keys[i] = None
+            _intern_vals[i] = None
+            _intern_kind[i] = _I_FREE
+        elif rules_changed and (kind == _I_DEST or kind == _I_WARN):
+            _intern_vals[i] = intern_value(kind, _intern_keys[i])
+
+def intern_pin(n):
+    """Keep the values of the first n departures, they are shown now."""
+    pin = _intern_pin
+    for i in range(_INTERN_SZ):
+        pin[i] = 0
+    for k in range(n):
+        pin[_dep_line[k]] = pin[_dep_typ[k]] = pin[_dep_dest[k]] = pin[_dep_col[k]] = 1
+
+def print_stats():
+    print("width cache: hits", _width_hits, "misses", _width_misses)
+    print("badge cache: hits", _badge_hits, "misses", _badge_misses,
+          "entries", len(_badge_cache), "bytes", _badge_bytes, "of", _badge_budget)
+    print("missing glyphs:", _missing_glyphs, "last:", hex(_missing_glyph_last))
+    print("gc: collections", _gc_count, "automatic", _gc_auto,
+          "last us", _gc_last_us, "max us", _gc_max_us,
+          "late frames", _frames_late, "after gc", _frames_late_gc)
+    print("display: skipped frames", _frames_skipped, "blitted MB", _blit_mb,
+          "idle frames", _frames_idle, "wake-ups", _display_wakeups,
+          "jitter us", _jitter_avg16 >> 4, "max", _jitter_max_us,
+          "columns drawn while published", _col_overlaps)
+    print("frame time: compose us", _compose_avg16 >> 4, "max", _compose_max_us,
+          "send us", _push_avg16 >> 4, "max", _push_max_us)
+    print("intern table: hits", _intern_hits, "misses", _intern_misses,
+          "entries", sum(1 for kind in _intern_kind if kind != _I_FREE), "of", _INTERN_SZ)
+    free = _atlas_sz - _atlas_used
+    largest = atlas_largest()
+    print("text atlas: used", _atlas_used, "of", _atlas_sz,
+          "(%d%%)" % (100 * _atlas_used // _atlas_sz),
+          "free blocks", len(_atlas_free), "largest", largest,
+          "fragmentation %d%%" % (100 - 100 * largest // free if free else 0),
+          "failed", _atlas_fails)
+
 async def data_fetch_task():
     """Fetches data every 10 seconds"""
-    global _dep_data, _time_set
+    global _dep_n, _time_set
+    global _dep_line, _dep_typ, _dep_dest, _dep_col, _dep_when, _dep_trip
+    global _dep_line_b, _dep_typ_b, _dep_dest_b, _dep_col_b, _dep_when_b, _dep_trip_b
     print("fetch task started")
     current_warn_id = 0
+    n_fetches = 0
     while True:
         try:
             await _safe_to_fetch.wait()
-            gc.collect()
+            await gc_collect()
             # print("fetching data")
             params = {
                 "results": "14",
@@ -795,32 +1837,39 @@ async def data_fetch_task():
                             "parsing:", time.ticks_diff(time.ticks_ms(), parse_start_ms)
                         )
 
-                        # Process parsed departures
-                        new_data = []
+                        # Process parsed departures into the spare arrays
+                        intern_expire()
+                        n = 0
                         filtered = settings.get("FILTERED")
                         for dep in data["departures"]:
+                            if n >= _DEPS_MAX:
+                                break
                             when = dep["when"]
                             if not when:
                                 continue
-                            when = parse_iso_to_epoch(when)
                             line_obj = dep["line"]
                             line = line_obj["name"]
                             if line in filtered:
                                 continue
-                            typ = line_obj["product"]
-                            # Clean up destination
-                            dest = dep["direction"] #.split(", ")[-1]
-                            dest = dest.replace(" [Endstelle]", "")
-                            dest = dest.replace(" (Berlin)", "")
-                            dest = dest.replace("  ", " ")
-                            dest = dest.strip()
-                            bg = parse_color(line_obj.get("color", {}).get("bg"))
-
-                            new_data.append((line, typ, dest, when, bg))
-                        # new_data[1] = (new_data[1][0], new_data[1][1], "S+U Zoologischer Garten", new_data[1][3], new_data[1][4])
-                        _dep_data = new_data
+                            _dep_when_b[n] = parse_iso_to_epoch(when)
+                            _dep_line_b[n] = intern(_I_LINE, line)
+                            _dep_typ_b[n] = intern(_I_TYP, line_obj["product"])
+                            _dep_dest_b[n] = intern(_I_DEST, dep["direction"])
+                            _dep_col_b[n] = intern(_I_COL, line_obj.get("color", {}).get("bg"))
+                            trip = dep.get("tripId")
+                            _dep_trip_b[n] = hash(trip) & 0x3FFFFFFF if trip else 0
+                            n += 1
+                        # _dep_dest_b[1] = intern(_I_DEST, "S+U Zoologischer Garten")
+                        _dep_line, _dep_line_b = _dep_line_b, _dep_line
+                        _dep_typ, _dep_typ_b = _dep_typ_b, _dep_typ
+                        _dep_dest, _dep_dest_b = _dep_dest_b, _dep_dest
+                        _dep_col, _dep_col_b = _dep_col_b, _dep_col
+                        _dep_when, _dep_when_b = _dep_when_b, _dep_when
+                        _dep_trip, _dep_trip_b = _dep_trip_b, _dep_trip
+                        _dep_n = n
+                        intern_pin(n)
                         warn_id = 0
-                        warn_msg = ""
+                        warn_summary = warn_text = 0
                         prio_min = 100
                         if (time.time() % _WARN_CYCLE) > _WARN_PAUSE:
                             for warn in data["warnings"]:
@@ -831,19 +1880,21 @@ async def data_fetch_task():
                                         and now >= parse_iso_to_epoch(warn["validFrom"])
                                         and now <= parse_iso_to_epoch(warn["validUntil"])):
                                     warn_id = warn["id"]
-                                    summary = warn["summary"]
-                                    text = warn["text"].split("\n")[0]
-                                    text = text.replace(" [Endstelle]", "")
-                                    text = text.replace(" (Berlin)", "")
-                                    text = text.replace("  ", " ")
-                                    warn_msg = f'{summary}: {text} *** '
+                                    warn_summary = intern(_I_LINE, warn["summary"])
+                                    warn_text = intern(_I_WARN, warn["text"])
                                     prio_min = prio+1
                             # if not warn_id:
                             #     warn_id = 99
-                            #     warn_msg = "Unterbrechung: Tram M1: Die Linie fährt aufgrund von Bauarbeiten nicht zwischen S Hackescher Markt und S+U Friedrichstraße. Umfahrung: tagsüber M5, S3, S5, S7, S9 & nachts Ersatzverkehr M1 bis S+U Friedrichstraße (Am Kupfergraben). *** "
-                            #     warn_msg = "Störung: Bus 100: Derzeit fährt die Linie nicht. Bitte nutzen Sie alternativ die U5. (S+U Alexanderplatz Bhf - U Bundestag) *** "
+                            #     warn_summary = intern(_I_LINE, "Unterbrechung")
+                            #     warn_text = intern(_I_WARN, "Tram M1: Die Linie fährt aufgrund von Bauarbeiten nicht zwischen S Hackescher Markt und S+U Friedrichstraße. Umfahrung: tagsüber M5, S3, S5, S7, S9 & nachts Ersatzverkehr M1 bis S+U Friedrichstraße (Am Kupfergraben).")
+                            #     warn_summary = intern(_I_LINE, "Störung")
+                            #     warn_text = intern(_I_WARN, "Bus 100: Derzeit fährt die Linie nicht. Bitte nutzen Sie alternativ die U5. (S+U Alexanderplatz Bhf - U Bundestag)")
                         if warn_id != current_warn_id:
                             current_warn_id = warn_id
+                            if warn_id:
+                                warn_msg = f'{_intern_vals[warn_summary]}: {_intern_vals[warn_text]} *** '
+                            else:
+                                warn_msg = ""
                             warn_msg_update(warn_msg)
                         print("updated data")
                     else:
@@ -856,6 +1907,9 @@ async def data_fetch_task():
             sys.print_exception(e)
 
         print("memfree:", gc.mem_free())
+        n_fetches += 1
+        if n_fetches % _STATS_INTERVAL == 0:
+            print_stats()
         # print("fetch finished")
         await asyncio.sleep(_FETCH_DELAY)
 
@@ -897,7 +1951,7 @@ async def check_night_time_task():
         if _dimming != dim:
             print("changing dimming")
             _dimming = dim
-            warn_msg_update()
+            await fade_brightness(dim * 100)
 
         await asyncio.sleep(85 - (now[6] + 30) % 60)
 
@@ -940,10 +1994,11 @@ async def main():
 
 banner()
 
-_warn_buf  = make_col(_WARN_BUF_SZ)
-_warn_buf_lock = _thread.allocate_lock()
+_eta_sheet = make_eta_sheet()
+_atlas = bytearray(_atlas_sz)
 _warn_msg = ""
-_warn_msg_sz = 0
+_warn_text = b""
+_warn_seq = 0
 
 # Start the event loop
 try:
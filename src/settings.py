@@ -7,6 +7,8 @@ DEFAULT_SETTINGS = {
     "WIFI_PASSWORD": "",
     "API_URL": "http://vbb.a6n.de",
     "FILTERED": [],
+    # [old, new] replacements applied to destinations and warnings
+    "TEXT_RULES": [[" [Endstelle]", ""], [" (Berlin)", ""]],
     "WALK_DELAY": 0,
     "COLORED": True,
     "SUBWAY_COLORS": True,
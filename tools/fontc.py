@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Compile the bitmap fonts in fonts/ into a module of packed bytes.
+
+Usage: python3 tools/fontc.py [fonts/font_bvg.py [src/font_bvg.py]]
+
+Every dict with a "fontheight" key in the source module is compiled. The
+generated module only contains bytes constants (and a tiny dict for glyphs
+outside Latin-1). Compiled with mpy-cross it imports without parsing any
+glyph data, and frozen into the firmware the glyphs stay in flash and cost
+no heap at all.
+"""
+import importlib.util
+import os
+import struct
+import sys
+
+# A packed font is a tuple (atlas, offsets, widths, cmap, bold_cmap, cmap_ext, kern_pairs):
+#   atlas:     bytes, all glyph columns back to back, one byte per column,
+#              bit n is pixel row n (fonts are 8 pixels high)
+#   offsets:   bytes, start of each glyph in the atlas as little endian uint16
+#   widths:    bytes, number of drawn columns of each glyph
+#   cmap:      bytes(256), Latin-1 code point -> glyph index
+#   bold_cmap: bytes(256), like cmap but bold variants where available
+#   cmap_ext:  dict, code points >= 256 -> glyph index
+#   kern_pairs: bytes, bit (prev * n_glyphs + next) is set if the two glyphs
+#              would touch (also diagonally) and need a one pixel gap when
+#              drawn with kerning
+
+NO_GLYPH = 0xFF
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def pack(src):
+    """Pack a font source dict into the compact tuple format above.
+
+    The source maps each character (and "*X" for the bold variant of X) to a
+    list of the advance width followed by one int per row, with the leftmost
+    pixel in bit (advance - 1) and bit 0 being the spacing column.
+    """
+    height = src["fontheight"]
+    if height != 8:
+        raise ValueError("only fonts with 8 rows are supported")
+    atlas = bytearray()
+    offsets = []
+    widths = bytearray()
+    cmap = bytearray(b"\xff" * 256)
+    bold = {}
+    cmap_ext = {}
+    for name, glyph in src.items():
+        if name == "fontheight":
+            continue
+        idx = len(widths)
+        if idx >= NO_GLYPH:
+            raise ValueError("too many glyphs")
+        width = glyph[0] - 1
+        offsets.append(len(atlas))
+        widths.append(width)
+        for col in range(width):
+            bit = 1 << (width - col)
+            bits = 0
+            for row in range(height):
+                if glyph[row + 1] & bit:
+                    bits |= 1 << row
+            atlas.append(bits)
+        if len(name) == 2 and name[0] == "*":
+            bold[ord(name[1])] = idx
+        elif ord(name) < 256:
+            cmap[ord(name)] = idx
+        elif ord(name) < 0x10000:
+            cmap_ext[ord(name)] = idx
+        else:
+            raise ValueError("code point out of range: %r" % name)
+    bold_cmap = bytearray(cmap)
+    for c, idx in bold.items():
+        bold_cmap[c] = idx
+    kern_pairs = _kern_pairs(atlas, offsets, widths)
+    offsets = struct.pack("<%dH" % len(offsets), *offsets)
+    return (bytes(atlas), offsets, bytes(widths), bytes(cmap), bytes(bold_cmap), cmap_ext, kern_pairs)
+
+
+def _kern_pairs(atlas, offsets, widths):
+    n = len(widths)
+    first = bytearray(n)
+    # pixels next to the rightmost column, one row up and down included
+    near = [0] * n
+    for g in range(n):
+        if widths[g]:
+            first[g] = atlas[offsets[g]]
+            last = atlas[offsets[g] + widths[g] - 1]
+            near[g] = last | (last << 1) | (last >> 1)
+    pairs = bytearray((n * n + 7) // 8)
+    bit = 0
+    for prev in range(n):
+        m = near[prev]
+        if m:
+            for g in range(n):
+                if first[g] & m:
+                    pairs[(bit + g) >> 3] |= 1 << ((bit + g) & 7)
+        bit += n
+    return bytes(pairs)
+
+
+def _bytes_literal(data, indent):
+    lines = [repr(data[i:i + 32]) for i in range(0, len(data), 32)] or ["b''"]
+    if len(lines) == 1:
+        return lines[0]
+    sep = "\n" + " " * (indent + 4)
+    return "(" + sep + sep.join(lines) + "\n" + " " * indent + ")"
+
+
+def compile_fonts(src_path, out_path):
+    spec = importlib.util.spec_from_file_location("font_src", src_path)
+    src = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(src)
+    fonts = [(name, value) for name, value in vars(src).items()
+             if isinstance(value, dict) and "fontheight" in value]
+    if not fonts:
+        raise ValueError("no fonts in %s" % src_path)
+    out = [
+        "# Generated by tools/fontc.py from %s, do not edit." % os.path.relpath(src_path, _ROOT),
+        "# The font format is described in tools/fontc.py.",
+    ]
+    for name, font in fonts:
+        atlas, offsets, widths, cmap, bold_cmap, cmap_ext, kern_pairs = pack(font)
+        out.append("")
+        out.append("%s = (" % name)
+        for comment, data in (("atlas", atlas), ("offsets", offsets), ("widths", widths),
+                              ("cmap", cmap), ("bold_cmap", bold_cmap)):
+            out.append("    # %s" % comment)
+            out.append("    %s," % _bytes_literal(data, 4))
+        out.append("    # cmap_ext")
+        out.append("    {%s}," % ", ".join("0x%04x: %d" % item for item in cmap_ext.items()))
+        out.append("    # kern_pairs")
+        out.append("    %s," % _bytes_literal(kern_pairs, 4))
+        out.append(")")
+        print("%s: %d glyphs, %d bytes packed" % (
+            name, len(widths),
+            len(atlas) + len(offsets) + len(widths) + len(cmap) + len(bold_cmap) + len(kern_pairs)))
+    with open(out_path, "w") as f:
+        f.write("\n".join(out) + "\n")
+
+
+def main():
+    src_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(_ROOT, "fonts", "font_bvg.py")
+    out_path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(_ROOT, "src", "font_bvg.py")
+    compile_fonts(src_path, out_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+# Run on the device with: mpremote run tools/measure_font.py
+# Prints the import time and heap cost of the font module on the device.
+import gc
+import time
+
+gc.collect()
+free = gc.mem_free()
+t = time.ticks_us()
+from font_bvg import font_small
+dt = time.ticks_diff(time.ticks_us(), t)
+gc.collect()
+print("import font_bvg: %d us, %d bytes of heap" % (dt, free - gc.mem_free()))